@@ -0,0 +1,286 @@
+import heapq
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+from search import (binary_search, batch_binary_search, ternary_search, EytzingerArray,
+                    interpolation_search, AdaptiveSearch)
+from specialized import fibonacci_search, AStar
+import other
+from other import dijkstra, multi_source_dijkstra, DynamicShortestPaths
+from csr import CSRGraph
+from contraction import ContractionHierarchy
+from queues import HeapqQueue, IndexedDaryHeap, BucketQueue
+from strings import KMPPattern, AhoCorasick
+
+
+def _timed(func, *args):
+    """Runs func(*args) once and returns (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def grid_graph(side, seed=0):
+    """
+    Generates a side x side grid road network as a weighted adjacency dict.
+    Nodes are (row, col) tuples and every edge has a random weight in [1, 10].
+    """
+    rng = random.Random(seed)
+    graph = {(r, c): [] for r in range(side) for c in range(side)}
+    for r in range(side):
+        for c in range(side):
+            for nr, nc in ((r + 1, c), (r, c + 1)):
+                if nr < side and nc < side:
+                    weight = rng.randint(1, 10)
+                    graph[(r, c)].append(((nr, nc), weight))
+                    graph[(nr, nc)].append(((r, c), weight))
+    return graph
+
+
+# Batched Binary Search Benchmark
+def benchmark_batch_binary_search(n=1_000_000, queries=1_000_000, seed=0):
+    """
+    Compares batch_binary_search with a per-call binary_search loop.
+    :param n: Size of the sorted array.
+    :param queries: Number of targets to resolve.
+    :param seed: Random seed for the generated targets.
+    """
+    rng = random.Random(seed)
+    arr = list(range(0, 2 * n, 2))  # Even numbers, so about half the targets miss
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+
+    looped, loop_time = _timed(lambda: [binary_search(arr, t) for t in targets])
+    batched, batch_time = _timed(batch_binary_search, arr, targets)
+    assert list(batched) == looped
+
+    print(f"Batch binary search (n={n:,}, queries={queries:,}):")
+    print(f"  binary_search loop:  {loop_time:.3f}s")
+    print(f"  batch_binary_search: {batch_time:.3f}s ({loop_time / batch_time:.1f}x)")
+
+
+# Eytzinger Layout Benchmark
+def benchmark_eytzinger(sizes=(10**3, 10**4, 10**5, 10**6), queries=200_000, seed=0):
+    """
+    Compares EytzingerArray with binary_search, ternary_search and fibonacci_search.
+    Sizes up to 10**8 can be passed in; they need several GB of memory and NumPy.
+    :param sizes: Array sizes to benchmark.
+    :param queries: Number of random targets per size.
+    :param seed: Random seed for the generated targets.
+    """
+    rng = random.Random(seed)
+    print(f"Eytzinger layout ({queries:,} queries per size, seconds):")
+    print(f"  {'n':>12} {'binary':>8} {'ternary':>8} {'fibonacci':>9} {'eytzinger':>9}"
+          f" {'batch_bin':>9} {'batch_eyt':>9}")
+    for n in sizes:
+        arr = array('q', range(0, 2 * n, 2))
+        targets = [rng.randrange(2 * n) for _ in range(queries)]
+        layout = EytzingerArray(arr)
+
+        _, binary_time = _timed(lambda: [binary_search(arr, t) for t in targets])
+        _, ternary_time = _timed(lambda: [ternary_search(arr, t, 0, n - 1) for t in targets])
+        _, fibonacci_time = _timed(lambda: [fibonacci_search(arr, t) for t in targets])
+        _, eytzinger_time = _timed(lambda: [layout.search(t) for t in targets])
+        expected, batch_binary_time = _timed(batch_binary_search, arr, targets)
+        batched, batch_eytzinger_time = _timed(layout.batch_search, targets)
+        assert list(batched) == list(expected)
+
+        print(f"  {n:>12,} {binary_time:>8.3f} {ternary_time:>8.3f} {fibonacci_time:>9.3f}"
+              f" {eytzinger_time:>9.3f} {batch_binary_time:>9.3f} {batch_eytzinger_time:>9.3f}")
+
+
+# Multi-Source Dijkstra Benchmark
+def benchmark_multi_source_dijkstra(side=100, num_sources=64, seed=0):
+    """
+    Compares serial dijkstra calls with multi_source_dijkstra on 1..cpu_count processes.
+    :param side: Grid side length (side * side nodes).
+    :param num_sources: Number of source nodes.
+    :param seed: Random seed for the graph and sources.
+    """
+    graph = grid_graph(side, seed)
+    csr = CSRGraph.from_dict(graph)
+    sources = random.Random(seed).sample(list(graph), num_sources)
+
+    _, serial_time = _timed(lambda: [dijkstra(graph, source) for source in sources])
+    print(f"Multi-source Dijkstra ({side * side:,} nodes, {num_sources} sources):")
+    print(f"  dijkstra loop (dict):  {serial_time:.3f}s")
+    processes = 1
+    while processes <= multiprocessing.cpu_count():
+        _, parallel_time = _timed(multi_source_dijkstra, csr, sources, processes)
+        print(f"  {processes:>2} process(es) (CSR): {parallel_time:.3f}s ({serial_time / parallel_time:.1f}x)")
+        processes *= 2
+
+
+# Priority Queue Backend Benchmark
+class _CountingHeapq:
+    """Stands in for heapq inside other.py to record the largest heap the inline loop builds."""
+    heappop = staticmethod(heapq.heappop)
+    heapify = staticmethod(heapq.heapify)
+
+    def __init__(self):
+        self.max_size = 0
+
+    def heappush(self, heap, item):
+        heapq.heappush(heap, item)
+        if len(heap) > self.max_size:
+            self.max_size = len(heap)
+
+
+def benchmark_priority_queues(side=150, seed=0):
+    """
+    Compares dijkstra's inline heapq loop with the pluggable queue backends:
+    peak queue entries, peak traced memory and runtime.
+    :param side: Grid side length (side * side nodes).
+    :param seed: Random seed for the graph.
+    """
+    graph = grid_graph(side, seed)
+    source = (0, 0)
+    backends = [
+        ('heapq (inline)', lambda: 'heapq'),
+        ('heapq (lazy)', HeapqQueue),
+        ('d-ary heap', IndexedDaryHeap),
+        ('bucket (Dial)', lambda: BucketQueue(max_weight=10)),
+    ]
+    print(f"Priority queues for dijkstra ({side * side:,} nodes):")
+    print(f"  {'backend':<15} {'max entries':>11} {'peak KiB':>9} {'time':>8}")
+    for name, make in backends:
+        _, elapsed = _timed(lambda: dijkstra(graph, source, queue=make()))
+        queue = make()
+        counter = queue
+        if queue == 'heapq':
+            counter = other.heapq = _CountingHeapq()  # Traces the inline loop's heap
+        tracemalloc.start()
+        try:
+            dijkstra(graph, source, queue=queue)
+        finally:
+            other.heapq = heapq
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:<15} {counter.max_size:>11} {peak / 1024:>9.0f} {elapsed:>7.3f}s")
+
+
+# Multi-Pattern Text Search Benchmark
+def benchmark_multi_pattern_search(num_patterns=(10, 100, 1000), text_size=200_000, seed=0):
+    """
+    Compares one KMPPattern scan per pattern with a single AhoCorasick scan.
+    :param num_patterns: Pattern counts to try.
+    :param text_size: Length of the random log-like text.
+    :param seed: Random seed for the text and patterns.
+    """
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz0123456789 "
+    text = ''.join(rng.choice(letters) for _ in range(text_size))
+    print(f"Multi-pattern search ({text_size:,} characters):")
+    print(f"  {'patterns':>8} {'kmp loop':>9} {'aho-corasick':>13} {'matches':>8}")
+    for count in num_patterns:
+        patterns = [''.join(rng.choice(letters) for _ in range(rng.randint(3, 6))) for _ in range(count)]
+        compiled = [KMPPattern(pattern) for pattern in patterns]
+        kmp_matches, kmp_time = _timed(lambda: sum(pattern.count(text) for pattern in compiled))
+        automaton = AhoCorasick(patterns)
+        ac_matches, ac_time = _timed(lambda: sum(automaton.counts(text)))
+        assert kmp_matches == ac_matches
+        print(f"  {count:>8} {kmp_time:>8.3f}s {ac_time:>12.3f}s {ac_matches:>8}")
+
+
+# Contraction Hierarchy Benchmark
+def benchmark_contraction_hierarchy(side=70, queries=200, seed=0):
+    """
+    Compares point-to-point queries of dijkstra, AStar (Manhattan heuristic) and a
+    ContractionHierarchy, and reports the hierarchy's build time, file size and load time.
+    :param side: Grid side length (side * side nodes).
+    :param queries: Number of random source/target pairs.
+    :param seed: Random seed for the graph and queries.
+    """
+    graph = grid_graph(side, seed)
+    rng = random.Random(seed)
+    pairs = [tuple(rng.sample(list(graph), 2)) for _ in range(queries)]
+    hierarchy, build_time = _timed(ContractionHierarchy, graph)
+    path = os.path.join(tempfile.mkdtemp(), "grid.ch")
+    hierarchy.save(path)
+    file_size = os.path.getsize(path)
+    loaded, load_time = _timed(ContractionHierarchy.load, path)
+
+    manhattan = lambda node, goal: abs(node[0] - goal[0]) + abs(node[1] - goal[1])  # Weights >= 1
+    astar = AStar(graph, manhattan)
+    distances, dijkstra_time = _timed(lambda: [dijkstra(graph, s, targets=t)[t] for s, t in pairs])
+    _, astar_time = _timed(lambda: [astar.search(s, t) for s, t in pairs])
+    ch_distances, ch_time = _timed(lambda: [loaded.distance(s, t) for s, t in pairs])
+    assert ch_distances == distances
+    loaded.close()
+    os.remove(path)
+
+    print(f"Contraction hierarchy ({side * side:,} nodes, {hierarchy.num_shortcuts:,} shortcuts):")
+    print(f"  build {build_time:.2f}s, file {file_size / 1024:.0f} KiB, load {load_time * 1000:.1f} ms")
+    for name, elapsed in (('dijkstra', dijkstra_time), ('AStar', astar_time), ('CH', ch_time)):
+        print(f"  {name:<9} {elapsed / queries * 1000:>8.3f} ms/query")
+
+
+# Dynamic Shortest Paths Benchmark
+def benchmark_dynamic_shortest_paths(side=150, updates=300, seed=0):
+    """
+    Applies random edge weight changes to a DynamicShortestPaths tree and compares the
+    repair cost (time and nodes touched) with rerunning dijkstra from scratch.
+    :param side: Grid side length (side * side nodes).
+    :param updates: Number of random edge updates.
+    :param seed: Random seed for the graph and updates.
+    """
+    graph = grid_graph(side, seed)
+    rng = random.Random(seed)
+    dynamic, build_time = _timed(DynamicShortestPaths, graph, (0, 0))
+    edges = [(u, v) for u in graph for v, _ in graph[u]]
+    touched = []
+    start = time.perf_counter()
+    for _ in range(updates):
+        u, v = rng.choice(edges)
+        touched.append(dynamic.update_edge(u, v, rng.randint(1, 10)))
+    update_time = (time.perf_counter() - start) / updates
+    print(f"Dynamic shortest paths ({side * side:,} nodes, {updates} updates):")
+    print(f"  initial build:   {build_time * 1000:.1f} ms, {side * side:,} nodes")
+    print(f"  per update:      {update_time * 1000:.3f} ms, {sum(touched) / updates:.1f} nodes touched"
+          f" on average (max {max(touched):,})")
+
+
+# Interpolation and Adaptive Search Benchmark
+def benchmark_adaptive_search(n=1_000_000, queries=100_000, seed=0):
+    """
+    Compares binary, interpolation, guarded interpolation and adaptive search on
+    uniformly distributed and on skewed (log-normal) keys, in microseconds per lookup.
+    Plain interpolation degrades towards O(n) on skewed keys, so it runs at most
+    100 lookups.
+    :param n: Number of sorted keys.
+    :param queries: Number of lookups per algorithm.
+    :param seed: Random seed for the keys and queries.
+    """
+    rng = random.Random(seed)
+    datasets = {
+        'uniform': sorted(rng.randrange(n * 100) for _ in range(n)),
+        'skewed': sorted(int(rng.lognormvariate(0, 3) * 1000) for _ in range(n)),
+    }
+    print(f"Interpolation and adaptive search ({n:,} keys, us per lookup):")
+    print(f"  {'keys':<8} {'binary':>7} {'interp':>8} {'guarded':>8} {'adaptive':>9}  choice")
+    for name, arr in datasets.items():
+        targets = [arr[rng.randrange(n)] for _ in range(queries)]
+        adaptive = AdaptiveSearch(arr)
+        per_lookup = lambda search, lookups: _timed(
+            lambda: [search(t) for t in lookups])[1] / len(lookups) * 1e6
+        binary_us = per_lookup(lambda t: binary_search(arr, t), targets)
+        interp_us = per_lookup(lambda t: interpolation_search(arr, t), targets[:100])
+        guarded_us = per_lookup(lambda t: interpolation_search(arr, t, guarded=True), targets)
+        adaptive_us = per_lookup(adaptive.search, targets)
+        print(f"  {name:<8} {binary_us:>7.2f} {interp_us:>8.2f} {guarded_us:>8.2f}"
+              f" {adaptive_us:>9.2f}  {adaptive.algorithm}")
+
+
+if __name__ == "__main__":
+    benchmark_batch_binary_search()
+    benchmark_eytzinger()
+    benchmark_adaptive_search()
+    benchmark_multi_source_dijkstra()
+    benchmark_priority_queues()
+    benchmark_multi_pattern_search()
+    benchmark_contraction_hierarchy()
+    benchmark_dynamic_shortest_paths()
@@ -0,0 +1,205 @@
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import wraps
+
+
+# Query Result Cache
+def _sizeof(value):
+    """Approximate memory footprint of a result: the object plus its direct items."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_sizeof(item) if isinstance(item, (dict, list, tuple)) else sys.getsizeof(item)
+                    for item in value)
+    return size
+
+
+def _version_of(obj):
+    """Mutation counter of a versioned object (trees.Graph, HashTable, ...), or None."""
+    version = getattr(obj, 'version', None)
+    return version if isinstance(version, int) else None
+
+
+def _key_part(obj, anchors):
+    """
+    Hashable stand-in for an argument. Unhashable objects are keyed by identity and
+    appended to anchors, weakly when possible (dicts and lists need a strong
+    reference), so a cached identity is never mistaken for a later object's.
+    """
+    try:
+        hash(obj)
+        return obj
+    except TypeError:
+        try:
+            anchors.append(weakref.ref(obj))
+        except TypeError:
+            anchors.append(obj)
+        return ('<id>', id(obj))
+
+
+def _anchors_alive(anchors):
+    """Whether every weakly referenced argument of an entry still exists."""
+    return all(anchor() is not None for anchor in anchors if isinstance(anchor, weakref.ref))
+
+
+class QueryCache:
+    """
+    Bounded cache of search results with LRU eviction, optional time-to-live and an
+    optional memory cap. Each entry remembers the versions of the objects it was
+    computed from; when a version changes (for example after trees.Graph.add_edge or
+    HashTable.insert) the entry is recomputed on its next lookup.
+    Unhashable arguments (dicts, lists) are keyed by identity: an entry keeps them
+    alive (or drops itself once a weakly referenced argument is collected), and
+    mutating them in place needs a version callable or clear().
+    Time Complexity: O(1) per lookup once the key is built; building it hashes the
+                     hashable arguments, which is O(len) for tuples and other
+                     containers on every call
+    """
+    def __init__(self, max_entries=1024, ttl=None, max_bytes=None, clock=time.monotonic):
+        """
+        :param max_entries: Maximum number of cached results.
+        :param ttl: Optional lifetime of an entry in seconds.
+        :param max_bytes: Optional cap on the approximate total size of the results.
+        :param clock: Time source for TTL expiry.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (value, versions, expires, size, anchors)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+        self.evictions = self.expirations = self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def stats(self):
+        """:return: Dictionary of hit/miss/eviction counters and current usage."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions, 'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries), 'bytes': self._bytes}
+
+    def lookup(self, key, versions=None):
+        """
+        :param key: Hashable query key.
+        :param versions: Versions the result must have been computed from.
+        :return: (True, value) on a hit, else (False, None).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, entry_versions, expires, _, anchors = entry
+                if entry_versions != versions or not _anchors_alive(anchors):
+                    self.invalidations += 1
+                    self._remove(key)
+                elif expires is not None and expires <= self._clock():
+                    self.expirations += 1
+                    self._remove(key)
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+            self.misses += 1
+            return False, None
+
+    def store(self, key, value, versions=None, anchors=()):
+        """
+        Caches value for key, evicting least recently used entries to stay in bounds.
+        :param anchors: Objects (or weak references) identified by id() in the key.
+        """
+        size = _sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Larger than the whole cache
+        expires = self._clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, versions, expires, size, tuple(anchors))
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[3]
+
+    def clear(self):
+        """Drops every entry; the statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def wrap(self, func, version=None):
+        """
+        Returns a cached version of a search function or bound method, e.g.
+        cache.wrap(dijkstra), cache.wrap(binary_search) or cache.wrap(astar.search).
+        :param func: The function to cache; its results must not be mutated by callers.
+        :param version: Optional zero-argument callable returning a token that changes
+                        whenever the underlying data does (e.g. lambda: graph.version).
+                        Arguments and bound objects with an integer version attribute
+                        are tracked automatically.
+        :return: The wrapped function, with the cache available as its .cache attribute.
+        """
+        owner = getattr(func, '__self__', None)
+
+        @wraps(func)
+        def cached(*args, **kwargs):
+            anchors = []
+            key = (func, tuple(_key_part(arg, anchors) for arg in args),
+                   tuple(sorted((name, _key_part(value, anchors)) for name, value in kwargs.items())))
+            versions = (version() if version is not None else None, _version_of(owner),
+                        tuple(_version_of(arg) for arg in args))
+            hit, value = self.lookup(key, versions)
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            self.store(key, value, versions, anchors)
+            return value
+
+        cached.cache = self
+        return cached
+
+
+# Test Cases
+if __name__ == "__main__":
+    from search import binary_search, HashTable
+    from other import dijkstra
+    from trees import Graph
+
+    print("Query Cache:")
+    cache = QueryCache(max_entries=128, ttl=60)
+    cached_binary_search = cache.wrap(binary_search)
+    arr = (1, 3, 5, 7, 9)
+    print("Binary Search:", cached_binary_search(arr, 7), cached_binary_search(arr, 7))  # Output: 3 3
+    print("Stats:", cache.stats()['hits'], "hit,", cache.stats()['misses'], "miss")  # Output: 1 hit, 1 miss
+
+    road = Graph()
+    road.add_edge('A', ('B', 2))
+    road.add_edge('B', ('C', 1))
+    road.add_edge('C', ('B', 1))
+    cached_dijkstra = cache.wrap(dijkstra, version=lambda: road.version)
+    print("Distances from A:", cached_dijkstra(road.adjacency_list, 'A'))  # Output: {'A': 0, 'B': 2, 'C': 3}
+    road.add_edge('A', ('C', 1))  # Bumps road.version, invalidating the cached result
+    print("After add_edge:", cached_dijkstra(road.adjacency_list, 'A'))  # Output: {'A': 0, 'B': 2, 'C': 1}
+
+    table = HashTable()
+    cached_lookup = cache.wrap(table.search)
+    table.insert('apple', 1)
+    print("Hash Table Search:", cached_lookup('apple'))  # Output: 1
+    table.insert('apple', 2)
+    print("After insert:", cached_lookup('apple'))  # Output: 2
+    print("Invalidations:", cache.stats()['invalidations'])  # Output: 2
@@ -0,0 +1,335 @@
+import queue
+import threading
+import weakref
+from array import array
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from numbers import Number
+
+
+# Compressed Sparse Row (CSR) Graph
+class CSRGraph:
+    """
+    Compressed Sparse Row Graph
+    ---------------------------
+    The out-edges of node u are targets[offsets[u]:offsets[u + 1]], with matching
+    weights. Nodes are integer ids 0..n-1; labels maps ids back to the original
+    node keys (None when the ids are the keys).
+    Space Complexity: O(V + E) in typed arrays, about 4-8 bytes per edge plus
+                      8 bytes per weight, instead of a tuple and list slot per edge
+    Use Case:
+        - Large, static graphs (road networks, social graphs)
+        - Accepted natively by dijkstra, bellman_ford, AStar and BidirectionalSearch,
+          and by every other search through the dict-like interface below
+    """
+    def __init__(self, offsets, targets, weights=None, labels=None):
+        """
+        Wraps prebuilt CSR arrays.
+        :param offsets: Array of n + 1 edge offsets.
+        :param targets: Array of edge targets (node ids).
+        :param weights: Optional array of edge weights, parallel to targets.
+        :param labels: Optional list mapping node ids to node keys.
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self._ids = {label: i for i, label in enumerate(labels)} if labels is not None else None
+
+    @classmethod
+    def from_edges(cls, edges, num_nodes=None, labels=None, weighted=None):
+        """
+        Builds a CSR graph from an edge list with a counting sort, in O(V + E).
+        :param edges: Iterable of (u, v) or (u, v, weight) tuples of node ids.
+        :param num_nodes: Number of nodes; defaults to the largest id + 1.
+        :param labels: Optional list mapping node ids to node keys.
+        :param weighted: Whether the graph carries weights; inferred from the edges
+                         when None (an edgeless graph is then unweighted).
+        :return: A new CSRGraph.
+        """
+        sources, targets, weights = array('q'), array('q'), array('d')
+        for edge in edges:
+            sources.append(edge[0])
+            targets.append(edge[1])
+            if len(edge) > 2:
+                weights.append(edge[2])
+        if weighted is None:
+            weighted = len(weights) > 0
+        if (weighted or weights) and len(weights) != len(targets):
+            raise ValueError("either all edges or none must carry a weight")
+        if num_nodes is None:
+            num_nodes = max(max(sources, default=-1), max(targets, default=-1)) + 1
+            if labels is not None:
+                num_nodes = max(num_nodes, len(labels))
+
+        offsets = array('q', [0]) * (num_nodes + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(num_nodes):
+            offsets[u + 1] += offsets[u]
+
+        typecode = 'i' if num_nodes < 2 ** 31 else 'q'
+        sorted_targets = array(typecode, [0]) * len(targets)
+        sorted_weights = array('d', [0.0]) * len(weights) if weighted else None
+        position = offsets[:-1]
+        for e, u in enumerate(sources):
+            slot = position[u]
+            position[u] = slot + 1
+            sorted_targets[slot] = targets[e]
+            if sorted_weights is not None:
+                sorted_weights[slot] = weights[e]
+        return cls(offsets, sorted_targets, sorted_weights, labels)
+
+    @classmethod
+    def from_dict(cls, adjacency, weighted=None):
+        """
+        Builds a CSR graph from the project's dict-of-lists adjacency format.
+        :param adjacency: {node: [neighbor, ...]} or {node: [(neighbor, weight), ...]}.
+        :param weighted: Whether entries are (neighbor, weight) pairs; detected when None
+                         from the first entry that is itself a node (unweighted) or whose
+                         first element is a node (weighted).
+        :return: A new CSRGraph whose labels are the original node keys.
+        """
+        if weighted is None:
+            weighted = cls._detect_weighted(adjacency)
+
+        labels = list(adjacency)
+        ids = {label: i for i, label in enumerate(labels)}
+
+        def node_id(label):
+            if label not in ids:  # Nodes that only appear as neighbors
+                ids[label] = len(labels)
+                labels.append(label)
+            return ids[label]
+
+        def edges():
+            for u, entries in adjacency.items():
+                u = ids[u]
+                for entry in entries:
+                    if weighted:
+                        yield u, node_id(entry[0]), entry[1]
+                    else:
+                        yield u, node_id(entry)
+
+        # labels keeps growing while from_edges consumes the generator
+        return cls.from_edges(edges(), labels=labels, weighted=weighted)
+
+    @staticmethod
+    def _detect_weighted(adjacency):
+        """
+        Tells (neighbor, weight) pairs from tuple-valued nodes such as (x, y) grid
+        coordinates, which share the same shape.
+        """
+        maybe_weighted = False
+        for entries in adjacency.values():
+            for entry in entries:
+                if not (isinstance(entry, tuple) and len(entry) == 2 and isinstance(entry[1], Number)):
+                    return False
+                if entry in adjacency:
+                    return False  # The pair is itself a node
+                if entry[0] in adjacency:
+                    return True
+                maybe_weighted = True
+        if maybe_weighted:
+            raise ValueError("cannot tell (neighbor, weight) pairs from tuple nodes; "
+                             "pass weighted=True or weighted=False")
+        return False
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def id_of(self, label):
+        """Returns the node id of a node key."""
+        return self._ids[label] if self._ids is not None else label
+
+    def label_of(self, node):
+        """Returns the node key of a node id."""
+        return self.labels[node] if self.labels is not None else node
+
+    def neighbor_ids(self, node):
+        """Returns the target ids of node's out-edges as an array slice."""
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def reverse(self):
+        """Returns the transposed graph (every edge u -> v becomes v -> u)."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+
+        def edges():
+            for u in range(self.num_nodes):
+                for e in range(offsets[u], offsets[u + 1]):
+                    if weights is not None:
+                        yield targets[e], u, weights[e]
+                    else:
+                        yield targets[e], u
+
+        return CSRGraph.from_edges(edges(), self.num_nodes, self.labels, weights is not None)
+
+    def to_shared_memory(self):
+        """
+        Copies the arrays into one SharedMemory block so worker processes can map the
+        graph instead of unpickling a copy per task. Labels are not shared.
+        :return: (block, layout); pass block.name and layout to attach_shared_memory and
+                 close and unlink the block when done.
+        """
+        n, m = self.num_nodes, self.num_edges
+        itemsize = self.targets.itemsize
+        target_bytes = (m * itemsize + 7) // 8 * 8  # Keep the weights 8-byte aligned
+        weight_bytes = 8 * m if self.weights is not None else 0
+        block = shared_memory.SharedMemory(create=True, size=max(8 * (n + 1) + target_bytes + weight_bytes, 1))
+        view = block.buf
+        end = 8 * (n + 1)
+        view[:end] = memoryview(self.offsets).cast('B')
+        view[end:end + m * itemsize] = memoryview(self.targets).cast('B')
+        if self.weights is not None:
+            view[end + target_bytes:end + target_bytes + weight_bytes] = memoryview(self.weights).cast('B')
+        return block, (n, m, self.targets.typecode, self.weights is not None)
+
+    @classmethod
+    def attach_shared_memory(cls, name, layout):
+        """
+        Maps a graph published by to_shared_memory without copying it.
+        :param name: Name of the SharedMemory block.
+        :param layout: Layout tuple returned by to_shared_memory.
+        :return: (block, graph); keep block referenced while the graph is in use.
+        """
+        n, m, typecode, weighted = layout
+        block = shared_memory.SharedMemory(name=name)
+        view = block.buf
+        end = 8 * (n + 1)
+        targets = view[end:end + m * array(typecode).itemsize].cast(typecode)
+        target_bytes = (len(targets) * targets.itemsize + 7) // 8 * 8
+        weights = view[end + target_bytes:end + target_bytes + 8 * m].cast('d') if weighted else None
+        return block, cls(view[:end].cast('q'), targets, weights)
+
+    # Dict-like interface, so code written for adjacency dicts accepts a CSRGraph
+    def __len__(self):
+        return self.num_nodes
+
+    def __iter__(self):
+        return iter(self.labels) if self.labels is not None else iter(range(self.num_nodes))
+
+    def __contains__(self, label):
+        if self._ids is not None:
+            return label in self._ids
+        return isinstance(label, int) and 0 <= label < self.num_nodes
+
+    def __getitem__(self, label):
+        """Returns the neighbors of a node key, as (neighbor, weight) pairs if weighted."""
+        if label not in self:
+            raise KeyError(label)
+        u = self.id_of(label)
+        start, end = self.offsets[u], self.offsets[u + 1]
+        neighbors = [self.label_of(v) for v in self.targets[start:end]]
+        if self.weights is None:
+            return neighbors
+        return list(zip(neighbors, self.weights[start:end]))
+
+    def get(self, label, default=None):
+        return self[label] if label in self else default
+
+
+# Reusable Search Context
+class SearchContext:
+    """
+    Preallocated per-node arrays for repeated searches on one CSRGraph.
+    distance[u] and parent[u] are only valid when stamp[u] equals the current
+    generation, and u is settled when settled[u] does; starting a new query just
+    increments the generation, so resetting costs O(1) instead of O(V).
+    Space Complexity: 32 bytes per node, allocated once
+    Use Case:
+        - High-QPS point-to-point queries with dijkstra(..., context=...) and
+          AStar.search(..., context=...), without per-query allocation
+    """
+    _local = threading.local()
+
+    def __init__(self, num_nodes):
+        self.num_nodes = num_nodes
+        self.distance = array('d', [float('inf')]) * num_nodes
+        self.parent = array('q', [-1]) * num_nodes
+        self.stamp = array('q', [0]) * num_nodes
+        self.settled = array('q', [0]) * num_nodes
+        self.generation = 0
+
+    def begin(self):
+        """Invalidates every entry of the previous query and returns the new generation."""
+        self.generation += 1
+        return self.generation
+
+    def distance_to(self, node):
+        """Returns the distance recorded for node id in the current query, or inf."""
+        return self.distance[node] if self.stamp[node] == self.generation else float('inf')
+
+    def path_to(self, node):
+        """Returns the node ids from the query's source to node, or None if unreached."""
+        if self.stamp[node] != self.generation:
+            return None
+        path = [node]
+        while self.parent[node] != -1:
+            node = self.parent[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+    @classmethod
+    def for_thread(cls, graph):
+        """Returns the calling thread's context for graph, creating it on first use."""
+        contexts = cls._local.__dict__.get('contexts')
+        if contexts is None:
+            contexts = cls._local.contexts = weakref.WeakKeyDictionary()
+        context = contexts.get(graph)
+        if context is None:
+            context = contexts[graph] = cls(graph.num_nodes)
+        return context
+
+
+class SearchContextPool:
+    """A thread-safe pool of SearchContexts for one graph, grown on demand."""
+    def __init__(self, graph, size=0):
+        """
+        :param graph: The CSRGraph the contexts are sized for.
+        :param size: Number of contexts to preallocate.
+        """
+        self.num_nodes = graph.num_nodes
+        self._free = queue.SimpleQueue()
+        for _ in range(size):
+            self._free.put(SearchContext(self.num_nodes))
+
+    def acquire(self):
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            return SearchContext(self.num_nodes)
+
+    def release(self, context):
+        self._free.put(context)
+
+    @contextmanager
+    def context(self):
+        """Borrows a context for the duration of a with block."""
+        context = self.acquire()
+        try:
+            yield context
+        finally:
+            self.release(context)
+
+
+# Test Cases
+if __name__ == "__main__":
+    weighted_graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 6)],
+        'C': [('A', 4), ('B', 2), ('D', 3)],
+        'D': [('B', 6), ('C', 3)]
+    }
+    csr = CSRGraph.from_dict(weighted_graph)
+    print("Nodes/edges:", csr.num_nodes, csr.num_edges)  # Output: 4 10
+    print("Offsets:", csr.offsets.tolist())  # Output: [0, 2, 5, 8, 10]
+    print("Neighbors of B:", csr['B'])  # Output: [('A', 1.0), ('C', 2.0), ('D', 6.0)]
+
+    edge_list = CSRGraph.from_edges([(0, 1), (0, 2), (2, 3)])
+    print("Neighbors of 0:", edge_list[0])  # Output: [1, 2]
@@ -0,0 +1,159 @@
+import math
+from hashlib import blake2b
+
+
+# Implicit (Lazy) Graphs
+class ImplicitGraph:
+    """
+    A graph defined by a successor function instead of an adjacency dict, for state
+    spaces too large to materialize. Neighbors are generated only when a search
+    expands a state, so memory grows with the states actually explored.
+    Supports the lookups the searches use on adjacency dicts: graph[state] and
+    graph.get(state) return (state, cost) pairs; it cannot list all of its states.
+    """
+    def __init__(self, neighbors, weighted=True):
+        """
+        :param neighbors: Function neighbors(state) -> iterable of (state, cost) pairs,
+                          or of bare states when weighted is False.
+        :param weighted: Whether neighbors yields costs; otherwise every edge costs 1.
+        """
+        self.neighbors = neighbors
+        self.weighted = weighted
+
+    def __getitem__(self, state):
+        if self.weighted:
+            return self.neighbors(state)
+        return ((neighbor, 1) for neighbor in self.neighbors(state))
+
+    def get(self, state, default=None):
+        return self[state]
+
+    def states(self, state):
+        """Yields the neighboring states of state, without costs."""
+        if self.weighted:
+            return (neighbor for neighbor, _ in self.neighbors(state))
+        return self.neighbors(state)
+
+    def __contains__(self, state):
+        return True
+
+    def __iter__(self):
+        raise TypeError("an ImplicitGraph cannot enumerate its states")
+
+
+def state_successors(graph):
+    """Returns a function yielding the neighboring states of a node in any graph format."""
+    if isinstance(graph, ImplicitGraph):
+        return graph.states
+    return lambda node: graph.get(node, ())
+
+
+# Compact Visited Sets
+#
+# Drop-in replacements for set() in the traversals' visited parameter: they support
+# add(state), state in visited and len(visited).
+
+def _digest(state):
+    """Stable 128-bit digest of a state's repr, split into two 64-bit integers."""
+    digest = blake2b(repr(state).encode(), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+
+
+class FingerprintSet:
+    """
+    Stores a 64-bit fingerprint per state instead of the state itself. Two distinct
+    states collide with probability about n^2 / 2^65, so for billions of states
+    treat membership as probabilistic.
+    """
+    def __init__(self, fingerprint=None):
+        """:param fingerprint: Optional function state -> int; defaults to a 64-bit digest."""
+        self._fingerprint = fingerprint or (lambda state: _digest(state)[0])
+        self._fingerprints = set()
+
+    def add(self, state):
+        self._fingerprints.add(self._fingerprint(state))
+
+    def __contains__(self, state):
+        return self._fingerprint(state) in self._fingerprints
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+
+class BitArraySet:
+    """
+    One bit per state for state spaces that can be ranked to integers 0..size-1
+    (e.g. puzzle permutations), so 1e9 states fit in 125 MB. Membership is exact.
+    """
+    def __init__(self, size, index=None):
+        """
+        :param size: Number of possible states.
+        :param index: Function state -> integer rank in [0, size); defaults to the state itself.
+        """
+        self._bits = bytearray((size + 7) // 8)
+        self._index = index or (lambda state: state)
+        self._count = 0
+
+    def add(self, state):
+        i = self._index(state)
+        mask = 1 << (i & 7)
+        if not self._bits[i >> 3] & mask:
+            self._bits[i >> 3] |= mask
+            self._count += 1
+
+    def __contains__(self, state):
+        i = self._index(state)
+        return bool(self._bits[i >> 3] & (1 << (i & 7)))
+
+    def __len__(self):
+        return self._count
+
+
+class BloomFilter:
+    """
+    Probabilistic visited set with a fixed memory budget. It never misses an added
+    state, but reports an unseen state as visited with probability about error_rate
+    once capacity states were added, which can prune parts of the search.
+    """
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        :param capacity: Expected number of states.
+        :param error_rate: Target false-positive rate at capacity.
+        """
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / max(capacity, 1) * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, state):
+        # Double hashing: k bit positions from two independent 64-bit hashes
+        h1, h2 = _digest(state)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, state):
+        new = False
+        for position in self._positions(state):
+            mask = 1 << (position & 7)
+            if not self._bits[position >> 3] & mask:
+                self._bits[position >> 3] |= mask
+                new = True
+        self._count += new
+
+    def __contains__(self, state):
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(state))
+
+    def __len__(self):
+        return self._count
+
+
+# Test Cases
+if __name__ == "__main__":
+    # Sliding counter puzzle: states are integers, moves add 1 or double
+    puzzle = ImplicitGraph(lambda n: [(n + 1, 1), (n * 2, 1)])
+    print("Successors of 5:", list(puzzle[5]))  # Output: [(6, 1), (10, 1)]
+    print("Successor states of 5:", list(puzzle.states(5)))  # Output: [6, 10]
+
+    for visited in (set(), FingerprintSet(), BitArraySet(1000), BloomFilter(capacity=1000)):
+        for state in range(0, 500, 7):
+            visited.add(state)
+        print(f"{type(visited).__name__}: {len(visited)} states, 14 seen: {14 in visited}")  # Output: 72 states, 14 seen: True
@@ -0,0 +1,191 @@
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+
+from search import binary_search, jump_search, exponential_search
+from specialized import fibonacci_search
+from storage import atomic_write
+
+
+# Writing Sorted Key Files
+def write_sorted_file(path, keys, typecode='q'):
+    """
+    Writes sorted keys to a fixed-width binary file in native byte order.
+    :param path: Destination file path.
+    :param keys: Iterable of sorted integers or floats.
+    :param typecode: array typecode of the records ('q' for int64, 'd' for float64, ...).
+    """
+    with open(path, 'wb') as f:
+        chunk = array(typecode)
+        for key in keys:
+            chunk.append(key)
+            if len(chunk) >= 1 << 16:
+                chunk.tofile(f)
+                chunk = array(typecode)
+        chunk.tofile(f)
+
+
+# Memory-Mapped Sorted File Search
+class MappedSortedFile:
+    """
+    Memory-Mapped Sorted File
+    -------------------------
+    Time Complexity:
+        Build: O(n / stride) (one key read per index entry), or reading the saved
+               index when the file is reopened
+        Lookup: O(log(n / stride)) in memory + O(log stride) on the mapped file
+    Space Complexity: O(n / stride) (the file itself is never loaded)
+    Use Case:
+        - Searching sorted key files larger than RAM
+        - The sparse index confines each lookup to one block of stride records,
+          so a lookup touches only a few pages of the file
+        - The index is saved beside the file, so reopening it touches no records
+    """
+    _INDEX_HEADER = struct.Struct('=4sc3x3q')  # magic, typecode, stride, data size, data mtime
+    _INDEX_MAGIC = b'MSI1'
+    _BLOCK_PAGES = 16  # Default block size in pages
+
+    def __init__(self, path, typecode='q', stride=None, persist_index=True):
+        """
+        Maps a fixed-width binary file of sorted keys.
+        :param path: Path of the file written by write_sorted_file.
+        :param typecode: array typecode of the records.
+        :param stride: Number of records per sparse index entry; defaults to 16 pages
+                       of records, so building the index reads one page in 16.
+        :param persist_index: Keep the sparse index in path + '.idx' and reuse it while
+                              the data file is unchanged, so reopening reads no records.
+        """
+        self.typecode = typecode
+        if stride is None:
+            stride = max(1, self._BLOCK_PAGES * mmap.PAGESIZE // array(typecode).itemsize)
+        self.stride = stride
+        self._file = open(path, 'rb')
+        self._mmap = None
+        stat = os.fstat(self._file.fileno())
+        if stat.st_size == 0:
+            self.keys = array(typecode)
+        else:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self._mmap, 'madvise') and hasattr(mmap, 'MADV_RANDOM'):
+                self._mmap.madvise(mmap.MADV_RANDOM)  # Lookups do not benefit from readahead
+            self.keys = memoryview(self._mmap).cast(typecode)
+
+        self.index_path = path + '.idx' if persist_index else None
+        signature = (typecode.encode(), stride, stat.st_size, stat.st_mtime_ns)
+        self.index = self._load_index(signature) if persist_index else None
+        if self.index is None:
+            self.index = self.keys[::stride].tolist()  # First key of every block
+            if persist_index:
+                self._save_index(signature)
+
+    def _load_index(self, signature):
+        """Returns the saved index if it was built for this file and stride, else None."""
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(self._INDEX_HEADER.size)
+                if len(header) != self._INDEX_HEADER.size:
+                    return None
+                magic, *saved = self._INDEX_HEADER.unpack(header)
+                if magic != self._INDEX_MAGIC or tuple(saved) != signature:
+                    return None
+                index = array(self.typecode)
+                index.frombytes(f.read())
+        except OSError:
+            return None
+        return index.tolist()
+
+    def _save_index(self, signature):
+        """Writes the index beside the data file; a read-only directory is not an error."""
+        try:
+            with atomic_write(self.index_path) as f:
+                f.write(self._INDEX_HEADER.pack(self._INDEX_MAGIC, *signature))
+                array(self.typecode, self.index).tofile(f)
+        except OSError:
+            pass
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, i):
+        return self.keys[i]
+
+    def _block(self, target):
+        """Returns the (left, right) record bounds of the block that may hold target."""
+        block = bisect_right(self.index, target) - 1
+        if block < 0:
+            return 0, -1
+        left = block * self.stride
+        return left, min(left + self.stride, len(self.keys)) - 1
+
+    def search(self, target):
+        """
+        Finds target with a sparse-index lookup followed by a binary search in one block.
+        :param target: Key to search for.
+        :return: Index of the target record, or -1 if not found.
+        """
+        left, right = self._block(target)
+        return binary_search(self.keys, target, left, right)
+
+    def lower_bound(self, target):
+        """Returns the index of the first record >= target."""
+        # The last block starting below target: a run of duplicates of target may
+        # begin there even when the next block also starts with target
+        block = max(bisect_left(self.index, target) - 1, 0)
+        left = block * self.stride
+        right = min(left + self.stride, len(self.keys))
+        while left < right:
+            mid = (left + right) // 2
+            if self.keys[mid] < target:
+                left = mid + 1
+            else:
+                right = mid
+        return left
+
+    def search_with(self, algorithm, target):
+        """
+        Runs one of the project's array searches directly on the mapped records.
+        :param algorithm: binary_search, jump_search, exponential_search or fibonacci_search.
+        :param target: Key to search for.
+        :return: Index of the target record, or -1 if not found.
+        """
+        return algorithm(self.keys, target)
+
+    def close(self):
+        """Releases the mapping and the underlying file."""
+        if isinstance(self.keys, memoryview):
+            self.keys.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Test Cases
+if __name__ == "__main__":
+    path = os.path.join(tempfile.mkdtemp(), "keys.bin")
+    write_sorted_file(path, range(0, 2_000_000, 2))
+
+    with MappedSortedFile(path, stride=256) as keys:
+        print("Records:", len(keys))  # Output: 1000000
+        print("Index of 123456:", keys.search(123456))  # Output: 61728
+        print("Index of 123457:", keys.search(123457))  # Output: -1
+        print("Lower bound of 123457:", keys.lower_bound(123457))  # Output: 61729
+        for algorithm in (binary_search, jump_search, exponential_search, fibonacci_search):
+            print(f"{algorithm.__name__} on mapped file:", keys.search_with(algorithm, 777776))  # Output: 388888
+
+    with MappedSortedFile(path) as keys:  # Default stride, index read from keys.bin.idx
+        print("Index entries:", len(keys.index), "stride:", keys.stride)  # Output: 123 stride: 8192 (4 KiB pages)
+        print("Index of 123456:", keys.search(123456))  # Output: 61728
+
+    duplicates_path = os.path.join(os.path.dirname(path), "duplicates.bin")
+    write_sorted_file(duplicates_path, [1, 1, 1, 1, 2, 5, 5, 5, 5, 5, 9])
+    with MappedSortedFile(duplicates_path, stride=3) as keys:  # Runs cross block boundaries
+        print("Lower bounds of 1, 5:", keys.lower_bound(1), keys.lower_bound(5))  # Output: 0 5
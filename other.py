@@ -1,67 +1,108 @@
+from array import array
 from collections import deque, defaultdict
 import heapq
+import multiprocessing
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; distance matrices fall back to array rows
+    np = None
+
+from csr import CSRGraph, SearchContext
+from implicit import ImplicitGraph, state_successors
+from queues import make_queue
+
 
 # Bidirectional Search
 class BidirectionalSearch:
-    def __init__(self, graph):
+    def __init__(self, graph, reverse_graph=None, weighted=False):
+        """
+        :param graph: Adjacency list of the graph, or a CSRGraph.
+        :param reverse_graph: The graph with every edge reversed, searched from the goal.
+                              Unweighted searches default to graph itself (undirected
+                              graphs); weighted searches build it once here, so an
+                              ImplicitGraph needs it passed explicitly.
+        :param weighted: Entries are (neighbor, weight) pairs; search() then runs
+                         bidirectional Dijkstra and returns a shortest weighted path.
+        """
         self.graph = graph
+        self.weighted = weighted
+        if reverse_graph is None:
+            if not weighted:
+                reverse_graph = graph
+            elif isinstance(graph, CSRGraph):
+                reverse_graph = graph.reverse()
+            else:
+                reverse_graph = reverse_adjacency(graph)
+        self.reverse_graph = reverse_graph
 
     def search(self, start, goal):
         """
-        Performs Bidirectional Search.
+        Performs Bidirectional Search, always expanding the smaller frontier.
         :param start: Start node.
         :param goal: Goal node.
         :return: List of nodes representing the path, or None if no path exists.
         """
         if start == goal:
             return [start]
+        if self.weighted:
+            return bidirectional_dijkstra(self.graph, start, goal, self.reverse_graph)[1]
+        if isinstance(self.graph, CSRGraph):
+            # Search over integer ids and map the path back to node keys
+            graph = self.graph
+            path = self._search(graph.id_of(start), graph.id_of(goal),
+                                graph.neighbor_ids, self.reverse_graph.neighbor_ids)
+            return [graph.label_of(node) for node in path] if path else None
+        return self._search(start, goal,
+                            state_successors(self.graph), state_successors(self.reverse_graph))
 
-        # Frontiers for BFS from start and goal
-        frontier_start = {start}
-        frontier_goal = {goal}
+    def _search(self, start, goal, forward, backward):
+        edges = (forward, backward)
+        parents = ({start: None}, {goal: None})
+        depths = ({start: 0}, {goal: 0})
+        frontiers = [[start], [goal]]
+        spare = []  # Reused as the next frontier, so levels do not allocate new lists
 
-        # Visited sets and parent dictionaries
-        visited_start = {start: None}
-        visited_goal = {goal: None}
+        while frontiers[0] and frontiers[1]:
+            # Expanding the smaller side keeps both search balls small
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            visited, other_visited = parents[side], parents[1 - side]
+            depth, other_depth = depths[side], depths[1 - side]
+            frontier, next_frontier = frontiers[side], spare
+            best, meeting_node = float('inf'), None
 
-        while frontier_start and frontier_goal:
-            # Expand from start
-            path = self._expand_frontier(frontier_start, visited_start, visited_goal)
-            if path:
-                return path
+            for node in frontier:
+                neighbor_depth = depth[node] + 1
+                for neighbor in edges[side](node):
+                    if neighbor in visited:
+                        continue
+                    visited[neighbor] = node
+                    depth[neighbor] = neighbor_depth
+                    next_frontier.append(neighbor)
+                    if neighbor in other_visited and neighbor_depth + other_depth[neighbor] < best:
+                        best = neighbor_depth + other_depth[neighbor]
+                        meeting_node = neighbor
 
-            # Expand from goal
-            path = self._expand_frontier(frontier_goal, visited_goal, visited_start)
-            if path:
-                return path
+            # Finish the whole level first so the shortest meeting point wins
+            if meeting_node is not None:
+                return self._reconstruct_path(parents[0], parents[1], meeting_node)
+            frontier.clear()
+            frontiers[side], spare = next_frontier, frontier
 
         return None  # No path found
 
-    def _expand_frontier(self, frontier, visited, other_visited):
-        next_frontier = set()
-        for node in frontier:
-            for neighbor in self.graph.get(node, []):
-                if neighbor not in visited:
-                    visited[neighbor] = node
-                    next_frontier.add(neighbor)
-                if neighbor in other_visited:
-                    return self._reconstruct_path(visited, other_visited, neighbor)
-        frontier.clear()
-        frontier.update(next_frontier)
-        return None
-
     def _reconstruct_path(self, visited_start, visited_goal, meeting_node):
         path = []
         # From start to meeting node
         current = meeting_node
-        while current:
+        while current is not None:
             path.append(current)
             current = visited_start[current]
         path.reverse()
 
         # From meeting node to goal
         current = visited_goal[meeting_node]
-        while current:
+        while current is not None:
             path.append(current)
             current = visited_goal[current]
 
@@ -69,46 +110,164 @@ class BidirectionalSearch:
 
 
 # Iterative Deepening Search (IDS)
-def iterative_deepening_search(graph, start, goal):
+def iterative_deepening_search(graph, start, goal, max_depth=None, transposition_size=None):
     """
-    Performs Iterative Deepening Search.
-    :param graph: Adjacency list of the graph.
+    Performs Iterative Deepening Search with an explicit stack and one shared path buffer.
+    :param graph: Adjacency list of the graph, or an ImplicitGraph.
     :param start: Start node.
     :param goal: Goal node.
+    :param max_depth: Optional depth limit; by default the search stops once an
+                      iteration no longer reaches its depth limit (goal unreachable).
+    :param transposition_size: Optional bound on a per-iteration table of the shallowest
+                               depth each node was reached at; nodes reached again no
+                               shallower than before are not re-explored.
     :return: List of nodes representing the path, or None if no path exists.
     """
-    def dls(node, depth, visited):
-        if depth == 0:
-            return [node] if node == goal else None
-        if depth > 0:
-            visited.add(node)
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    path = dls(neighbor, depth - 1, visited)
-                    if path:
-                        return [node] + path
-            visited.remove(node)
-        return None
+    if start == goal:
+        return [start]
+    successors = state_successors(graph)
 
-    depth = 0
-    while True:
-        visited = set()
-        path = dls(start, depth, visited)
+    def depth_limited(limit):
+        """Returns (path or None, whether some node was cut off at the depth limit)."""
+        table = {start: 0} if transposition_size else None
+        path, on_path = [start], {start}
+        stack = [iter(successors(start))]
+        cut_off = False
+
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor in on_path:
+                    continue
+                depth = len(path)
+                if neighbor == goal:
+                    path.append(neighbor)
+                    return path, cut_off
+                if table is not None:
+                    seen = table.get(neighbor)
+                    if seen is not None and seen <= depth:
+                        continue
+                    if seen is not None or len(table) < transposition_size:
+                        table[neighbor] = depth
+                if depth == limit:
+                    for _ in successors(neighbor):
+                        cut_off = True  # neighbor has unexplored successors
+                        break
+                    continue
+                path.append(neighbor)
+                on_path.add(neighbor)
+                stack.append(iter(successors(neighbor)))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+        return None, cut_off
+
+    depth = 1
+    while max_depth is None or depth <= max_depth:
+        path, cut_off = depth_limited(depth)
         if path:
             return path
+        if not cut_off:
+            return None  # Every node within reach was explored
         depth += 1
+    return None
+
+
+# Iterative Deepening A* (IDA*)
+def ida_star(graph, start, goal, heuristic, max_cost=float('inf')):
+    """
+    Performs IDA*: depth-first searches bounded by f = g + h, raising the bound to the
+    smallest f that exceeded it. Memory is O(d) for the explicit stack and path buffer.
+    :param graph: Weighted adjacency list of the graph.
+    :param start: Start node.
+    :param goal: Goal node.
+    :param heuristic: Dictionary of admissible heuristic costs, or a callable
+                      heuristic(node, goal).
+    :param max_cost: Give up once the bound exceeds this cost.
+    :return: List of nodes representing a shortest path, or None if no path exists.
+    """
+    if isinstance(heuristic, dict):
+        h = heuristic.__getitem__
+    else:
+        h = lambda node: heuristic(node, goal)
+    if start == goal:
+        return [start]
+
+    bound = h(start)
+    while bound <= max_cost:
+        path, on_path, costs = [start], {start}, [0]
+        stack = [iter(graph.get(start, ()))]
+        next_bound = float('inf')
+
+        while stack:
+            for neighbor, weight in stack[-1]:
+                if neighbor in on_path:
+                    continue
+                g = costs[-1] + weight
+                f = g + h(neighbor)
+                if f > bound:
+                    next_bound = min(next_bound, f)
+                    continue
+                if neighbor == goal:
+                    return path + [neighbor]
+                path.append(neighbor)
+                on_path.add(neighbor)
+                costs.append(g)
+                stack.append(iter(graph.get(neighbor, ())))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+                costs.pop()
+
+        if next_bound == float('inf'):
+            return None  # Nothing left beyond the bound
+        bound = next_bound
+    return None
 
 
 # Dijkstra's Algorithm
-def dijkstra(graph, start):
+def dijkstra(graph, start, targets=None, max_distance=None, predecessors=False, context=None,
+             queue='heapq'):
     """
     Finds the shortest paths from a starting node using Dijkstra's algorithm.
-    :param graph: Weighted adjacency list of the graph.
+    :param graph: Weighted adjacency list of the graph, a CSRGraph or an ImplicitGraph.
     :param start: Start node.
-    :return: Dictionary of shortest distances to all nodes from the start.
+    :param targets: Optional node, or set/list of nodes; the search stops once all of
+                    them are settled.
+    :param max_distance: Optional bound; nodes farther than this are not settled.
+    :param predecessors: Also return the predecessor map for reconstruct_path.
+    :param context: Optional SearchContext to reuse across queries on a CSRGraph; the
+                    search then allocates nothing proportional to the graph size.
+    :param queue: Priority queue backend: 'heapq' (lazy deletion), 'dary' (indexed
+                  4-ary heap with decrease-key), 'bucket' (Dial's buckets, for small
+                  integer weights) or a queue object from the queues module.
+    :return: Dictionary of shortest distances to all nodes from the start. With targets
+             or max_distance, or on an ImplicitGraph, only the nodes settled before
+             stopping are included.
+             With predecessors=True, a (distances, predecessors) tuple.
     """
-    distances = {node: float('inf') for node in graph}
+    if targets is not None and not isinstance(targets, (set, frozenset, list)):
+        targets = [targets]
+    if context is not None:
+        if not isinstance(graph, CSRGraph):
+            raise TypeError("search contexts require a CSRGraph")
+        return _context_dijkstra(graph, start, targets, max_distance, predecessors, context)
+    if queue != 'heapq':
+        return _queue_dijkstra(graph, start, targets, max_distance, predecessors,
+                               make_queue(queue))
+    if isinstance(graph, CSRGraph):
+        return _csr_dijkstra(graph, start, targets, max_distance, predecessors)
+
+    # Implicit graphs cannot be enumerated, so only the reached states are returned
+    goal_directed = targets is not None or max_distance is not None or isinstance(graph, ImplicitGraph)
+    remaining = set(targets) if targets is not None else None
+    if goal_directed:
+        distances, settled = {}, {}  # Only touch the nodes the search reaches
+    else:
+        distances, settled = {node: float('inf') for node in graph}, None
     distances[start] = 0
+    parents = {start: None} if predecessors else None
     pq = [(0, start)]  # Priority queue as (distance, node)
 
     while pq:
@@ -116,33 +275,537 @@ def dijkstra(graph, start):
 
         if current_distance > distances[current_node]:
             continue
+        if goal_directed:
+            if max_distance is not None and current_distance > max_distance:
+                break
+            settled[current_node] = current_distance
+            if remaining is not None:
+                remaining.discard(current_node)
+                if not remaining:
+                    break
 
         for neighbor, weight in graph[current_node]:
             distance = current_distance + weight
-            if distance < distances[neighbor]:
+            if distance < distances.get(neighbor, float('inf')):
                 distances[neighbor] = distance
+                if parents is not None:
+                    parents[neighbor] = current_node
                 heapq.heappush(pq, (distance, neighbor))
 
+    result = settled if goal_directed else distances
+    return (result, parents) if predecessors else result
+
+
+def reconstruct_path(predecessors, target):
+    """
+    Rebuilds the shortest path to target from a predecessor map returned by dijkstra.
+    :param predecessors: Dictionary mapping each reached node to its predecessor.
+    :param target: Goal node.
+    :return: List of nodes from the start to target, or None if target was not reached.
+    """
+    if target not in predecessors:
+        return None
+    path = []
+    while target is not None:
+        path.append(target)
+        target = predecessors[target]
+    path.reverse()
+    return path
+
+
+def _csr_dijkstra(graph, start, targets=None, max_distance=None, predecessors=False):
+    """Dijkstra's algorithm over the flat arrays of a CSRGraph."""
+    goal_directed = targets is not None or max_distance is not None
+    settled = {} if goal_directed else None
+    parents = {} if predecessors else None
+    target_ids = {graph.id_of(target) for target in targets} if targets is not None else None
+    distances = _csr_distances(graph, graph.id_of(start), target_ids, max_distance, settled, parents)
+
+    label = graph.label_of
+    if goal_directed:
+        result = {label(node): distance for node, distance in settled.items()}
+    else:
+        result = {label(node): distance for node, distance in enumerate(distances)}
+    if not predecessors:
+        return result
+    parents = {label(node): (label(parent) if parent is not None else None)
+               for node, parent in parents.items()}
+    return result, parents
+
+
+def _csr_distances(graph, source, target_ids=None, max_distance=None, settled=None, parents=None):
+    """
+    Returns the list of shortest distances from node id source, indexed by node id.
+    target_ids and max_distance stop the search early; settled and parents,
+    when given, are filled with the settled distances and the predecessor of each node.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [float('inf')] * graph.num_nodes
+    distances[source] = 0
+    remaining = set(target_ids) if target_ids is not None else None
+    if parents is not None:
+        parents[source] = None
+    pq = [(0, source)]
+
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+
+        if current_distance > distances[u]:
+            continue
+        if settled is not None:
+            if max_distance is not None and current_distance > max_distance:
+                break
+            settled[u] = current_distance
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            distance = current_distance + weights[e]
+            if distance < distances[v]:
+                distances[v] = distance
+                if parents is not None:
+                    parents[v] = u
+                heapq.heappush(pq, (distance, v))
+
     return distances
 
 
+def _queue_dijkstra(graph, start, targets, max_distance, predecessors, pq):
+    """Dijkstra driven by a decrease-key priority queue from the queues module."""
+    if isinstance(graph, CSRGraph):
+        edges, label = _csr_edges(graph), graph.label_of
+        start = graph.id_of(start)
+        if targets is not None:
+            targets = [graph.id_of(target) for target in targets]
+    else:
+        edges, label = graph.__getitem__, None
+    remaining = set(targets) if targets is not None else None
+    settled = {}
+    tentative = {start: 0}
+    parents = {start: None}
+    pq.push(start, 0)
+
+    while pq:
+        current_distance, node = pq.pop()
+        if max_distance is not None and current_distance > max_distance:
+            break
+        settled[node] = current_distance
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        for neighbor, weight in edges(node):
+            distance = current_distance + weight
+            if neighbor not in settled and distance < tentative.get(neighbor, float('inf')):
+                tentative[neighbor] = distance
+                parents[neighbor] = node
+                pq.push(neighbor, distance)
+
+    if targets is None and max_distance is None and not isinstance(graph, ImplicitGraph):
+        nodes = range(graph.num_nodes) if label is not None else graph
+        settled = {node: settled.get(node, float('inf')) for node in nodes}
+    if label is not None:
+        settled = {label(node): distance for node, distance in settled.items()}
+        parents = {label(node): (label(parent) if parent is not None else None)
+                   for node, parent in parents.items()}
+    return (settled, parents) if predecessors else settled
+
+
+def _context_dijkstra(graph, start, goals, max_distance, predecessors, context):
+    """Dijkstra over a CSRGraph that keeps its state in a reusable SearchContext."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distance, parent, stamp, settled = context.distance, context.parent, context.stamp, context.settled
+    generation = context.begin()
+    source = graph.id_of(start)
+    distance[source], parent[source], stamp[source] = 0, -1, generation
+    remaining = {graph.id_of(goal) for goal in goals} if goals is not None else None
+    reached = [source]
+    order = []  # Nodes in the order they are settled
+    pq = [(0, source)]
+
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+
+        if settled[u] == generation:
+            continue
+        if max_distance is not None and current_distance > max_distance:
+            break
+        settled[u] = generation
+        order.append(u)
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            new_distance = current_distance + weights[e]
+            if stamp[v] != generation:
+                stamp[v] = generation
+                reached.append(v)
+            elif new_distance >= distance[v]:
+                continue
+            distance[v] = new_distance
+            parent[v] = u
+            heapq.heappush(pq, (new_distance, v))
+
+    label = graph.label_of
+    if goals is not None or max_distance is not None:
+        result = {label(u): distance[u] for u in order}
+    else:
+        result = {label(u): context.distance_to(u) for u in range(graph.num_nodes)}
+    if not predecessors:
+        return result
+    parents = {label(u): (label(parent[u]) if parent[u] != -1 else None) for u in reached}
+    return result, parents
+
+
+# Dynamic Shortest Paths
+class DynamicShortestPaths:
+    """
+    Single-source shortest paths that stay up to date as edges change. The
+    distances and shortest-path tree come from one dijkstra run; afterwards each
+    change repairs only the nodes it can affect:
+      - a cheaper or new edge u -> v starts a Dijkstra from v that stops where
+        distances no longer improve;
+      - a dearer or removed tree edge u -> v invalidates the subtree below v, which
+        is reattached from its cheapest unaffected in-neighbors and then settled
+        by a Dijkstra restricted to that subtree;
+      - other changes leave every distance as it is.
+    Each graph keeps one edge per node pair; weights must be non-negative.
+    """
+    def __init__(self, graph, source):
+        """
+        :param graph: Weighted adjacency list {node: [(neighbor, weight), ...]}, or a
+                      CSRGraph. Parallel edges collapse to the cheapest one.
+        :param source: Start node.
+        """
+        self.source = source
+        self._out = defaultdict(dict)
+        self._in = defaultdict(dict)
+        for u in graph:
+            for v, weight in graph[u]:
+                if weight < self._out[u].get(v, float('inf')):
+                    self._out[u][v] = weight
+                    self._in[v][u] = weight
+        adjacency = {u: edges.items() for u, edges in self._out.items()}
+        for v in self._in:
+            adjacency.setdefault(v, ())
+        adjacency.setdefault(source, ())
+        self.distances, self.parents = dijkstra(adjacency, source, max_distance=float('inf'),
+                                                predecessors=True)
+        self._children = defaultdict(set)
+        for node, parent in self.parents.items():
+            if parent is not None:
+                self._children[parent].add(node)
+        self.last_touched = 0  # Nodes whose distance the last change recomputed
+
+    def distance_to(self, node):
+        """:return: Current shortest distance to node, or inf if it is unreachable."""
+        return self.distances.get(node, float('inf'))
+
+    def path_to(self, node):
+        """:return: Current shortest path to node, or None if it is unreachable."""
+        return reconstruct_path(self.parents, node)
+
+    def add_edge(self, u, v, weight):
+        """
+        Adds the edge u -> v, keeping the cheaper weight if it already exists.
+        :return: Number of nodes touched by the repair.
+        """
+        if weight >= self._out[u].get(v, float('inf')):
+            self.last_touched = 0
+            return 0
+        return self.update_edge(u, v, weight)
+
+    def update_edge(self, u, v, weight):
+        """
+        Sets the weight of the edge u -> v, adding it if it does not exist.
+        :return: Number of nodes touched by the repair.
+        """
+        old_weight = self._out[u].get(v)
+        self._out[u][v] = weight
+        self._in[v][u] = weight
+        if old_weight is None or weight < old_weight:
+            touched = self._decrease(u, v, weight)
+        elif weight > old_weight and self.parents.get(v) == u:
+            touched = self._increase(v)
+        else:
+            touched = 0
+        self.last_touched = touched
+        return touched
+
+    def remove_edge(self, u, v):
+        """
+        Removes the edge u -> v (a missing edge is ignored).
+        :return: Number of nodes touched by the repair.
+        """
+        touched = 0
+        if v in self._out[u]:
+            del self._out[u][v]
+            del self._in[v][u]
+            if self.parents.get(v) == u:
+                touched = self._increase(v)
+        self.last_touched = touched
+        return touched
+
+    def _attach(self, node, parent):
+        old_parent = self.parents.get(node)
+        if old_parent is not None:
+            self._children[old_parent].discard(node)
+        self.parents[node] = parent
+        if parent is not None:
+            self._children[parent].add(node)
+
+    def _decrease(self, u, v, weight):
+        """Propagates the improvement of v through u -> v with a Dijkstra from v."""
+        distances, out = self.distances, self._out
+        distance = distances.get(u, float('inf')) + weight
+        if distance >= distances.get(v, float('inf')):
+            return 0
+        distances[v] = distance
+        self._attach(v, u)
+        pq = [(distance, v)]
+        touched = 0
+
+        while pq:
+            current_distance, node = heapq.heappop(pq)
+            if current_distance > distances[node]:
+                continue
+            touched += 1
+            for neighbor, weight in out[node].items():
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    self._attach(neighbor, node)
+                    heapq.heappush(pq, (distance, neighbor))
+        return touched
+
+    def _increase(self, root):
+        """Recomputes the shortest-path subtree below root after its tree edge got dearer."""
+        distances, out, into = self.distances, self._out, self._in
+        affected, stack = [], [root]
+        while stack:
+            node = stack.pop()
+            affected.append(node)
+            stack.extend(self._children[node])
+        affected_set = set(affected)
+        for node in affected:
+            del distances[node]
+            self._attach(node, None)
+            del self.parents[node]
+
+        # Best way back in from the unaffected part of the tree, whose distances hold
+        pq = []
+        for node in affected:
+            best, best_parent = float('inf'), None
+            for parent, weight in into[node].items():
+                if parent not in affected_set and parent in distances:
+                    distance = distances[parent] + weight
+                    if distance < best:
+                        best, best_parent = distance, parent
+            if best_parent is not None:
+                distances[node] = best
+                self._attach(node, best_parent)
+                pq.append((best, node))
+        heapq.heapify(pq)
+
+        while pq:
+            current_distance, node = heapq.heappop(pq)
+            if current_distance > distances[node]:
+                continue
+            for neighbor, weight in out[node].items():
+                if neighbor not in affected_set:
+                    continue  # Distances outside the subtree cannot have changed
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    self._attach(neighbor, node)
+                    heapq.heappush(pq, (distance, neighbor))
+        return len(affected)
+
+
+# Bidirectional Dijkstra
+def reverse_adjacency(graph):
+    """Returns the weighted adjacency dict with every edge u -> v reversed."""
+    reverse = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbor, weight in edges:
+            reverse.setdefault(neighbor, []).append((node, weight))
+    return reverse
+
+
+def bidirectional_dijkstra(graph, start, goal, reverse_graph=None):
+    """
+    Point-to-point shortest path that grows Dijkstra searches from both ends and stops
+    once the two smallest queue keys add up to at least the best path found so far.
+    :param graph: Weighted adjacency list of the graph, or a CSRGraph.
+    :param start: Start node.
+    :param goal: Goal node.
+    :param reverse_graph: The graph with all edges reversed. Built on each call when
+                          omitted; pass it in (or the graph itself if undirected) for
+                          repeated queries.
+    :return: (distance, path) tuple, or (inf, None) if goal is unreachable.
+    """
+    if start == goal:
+        return 0, [start]
+    if isinstance(graph, CSRGraph):
+        if reverse_graph is None:
+            reverse_graph = graph.reverse()
+        distance, path = _bidirectional_dijkstra(
+            _csr_edges(graph), _csr_edges(reverse_graph), graph.id_of(start), graph.id_of(goal))
+        return distance, [graph.label_of(node) for node in path] if path else None
+
+    if reverse_graph is None:
+        reverse_graph = reverse_adjacency(graph)
+    return _bidirectional_dijkstra(lambda node: graph.get(node, ()),
+                                   lambda node: reverse_graph.get(node, ()), start, goal)
+
+
+def _csr_edges(graph):
+    """Returns a function yielding the (neighbor id, weight) pairs of a node id."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    return lambda u: zip(targets[offsets[u]:offsets[u + 1]], weights[offsets[u]:offsets[u + 1]])
+
+
+def _bidirectional_dijkstra(forward, backward, start, goal):
+    edges = (forward, backward)
+    distances = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    queues = ([(0, start)], [(0, goal)])
+    best, meeting_node = float('inf'), None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break  # No path through unsettled nodes can be shorter
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        dist, other_dist = distances[side], distances[1 - side]
+        current_distance, node = heapq.heappop(queues[side])
+        if current_distance > dist[node]:
+            continue
+
+        for neighbor, weight in edges[side](node):
+            distance = current_distance + weight
+            if distance < dist.get(neighbor, float('inf')):
+                dist[neighbor] = distance
+                parents[side][neighbor] = node
+                heapq.heappush(queues[side], (distance, neighbor))
+            if neighbor in other_dist and dist[neighbor] + other_dist[neighbor] < best:
+                best = dist[neighbor] + other_dist[neighbor]
+                meeting_node = neighbor
+
+    if meeting_node is None:
+        return float('inf'), None
+    path = reconstruct_path(parents[0], meeting_node)
+    node = parents[1][meeting_node]
+    while node is not None:
+        path.append(node)
+        node = parents[1][node]
+    return best, path
+
+
+# Multi-Source Dijkstra
+_worker_graph = None  # (SharedMemory block, CSRGraph) attached in each pool worker
+
+
+def _attach_worker_graph(name, layout):
+    global _worker_graph
+    _worker_graph = CSRGraph.attach_shared_memory(name, layout)
+
+
+def _worker_distances(source):
+    return source, array('d', _csr_distances(_worker_graph[1], source))
+
+
+def multi_source_dijkstra(graph, sources, processes=None, stream=False):
+    """
+    Runs Dijkstra's algorithm from many sources in parallel worker processes.
+    The graph is converted to CSR and published once through shared memory.
+    :param graph: Weighted adjacency list of the graph, or a CSRGraph.
+    :param sources: List of start nodes.
+    :param processes: Number of worker processes (defaults to the CPU count); 1 runs
+                      in the calling process.
+    :param stream: Yield (source, distances) pairs as they complete instead of
+                   returning a matrix.
+    :return: Distance matrix with one row per source and one column per node id
+             (graph.labels order for a CSRGraph built from a dict). The matrix is a
+             NumPy array when NumPy is installed, else a list of array('d') rows.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph, weighted=True)
+    results = _multi_source_distances(graph, sources, processes)
+    if stream:
+        return results
+
+    rows = dict(results)
+    if np is not None:
+        matrix = np.empty((len(sources), graph.num_nodes))
+        for i, source in enumerate(sources):
+            matrix[i] = np.frombuffer(rows[source], dtype=np.float64)
+        return matrix
+    return [rows[source] for source in sources]
+
+
+def _multi_source_distances(graph, sources, processes):
+    """Yields (source, array of distances) for every source, in completion order."""
+    ids = {graph.id_of(source): source for source in sources}
+    if processes == 1 or len(ids) <= 1:
+        for node, source in ids.items():
+            yield source, array('d', _csr_distances(graph, node))
+        return
+
+    block, layout = graph.to_shared_memory()
+    try:
+        with multiprocessing.Pool(processes, _attach_worker_graph, (block.name, layout)) as pool:
+            chunksize = max(1, len(ids) // (4 * (processes or multiprocessing.cpu_count())))
+            for node, distances in pool.imap_unordered(_worker_distances, ids, chunksize):
+                yield ids[node], distances
+    finally:
+        block.close()
+        block.unlink()
+
+
 # Bellman-Ford Algorithm
-def bellman_ford(graph, start):
+def bellman_ford(graph, start, method='passes'):
     """
     Solves the single-source shortest path problem using the Bellman-Ford algorithm.
     :param graph: Weighted adjacency list of the graph.
     :param start: Start node.
+    :param method: 'passes' relaxes every edge per pass and stops early once a pass
+                   changes nothing; 'spfa' (queue-based) only relaxes the edges of nodes
+                   whose distance changed; 'numpy' relaxes all edges of a CSR edge
+                   array per pass with vectorized operations.
     :return: Dictionary of shortest distances to all nodes from the start, or None if a negative cycle is detected.
     """
+    if method == 'spfa':
+        if isinstance(graph, CSRGraph):
+            distances = _spfa(_csr_edges(graph), range(graph.num_nodes), graph.id_of(start))
+            return {graph.label_of(node): d for node, d in distances.items()} if distances else None
+        return _spfa(lambda node: graph.get(node, ()), graph, start)
+    if method == 'numpy':
+        return _numpy_bellman_ford(graph, start)
+    if method != 'passes':
+        raise ValueError(f"unknown Bellman-Ford method: {method!r}")
+    if isinstance(graph, CSRGraph):
+        return _csr_bellman_ford(graph, start)
+
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
 
-    # Relax edges up to |V| - 1 times
+    # Relax edges up to |V| - 1 times, stopping once distances have converged
     for _ in range(len(graph) - 1):
+        changed = False
         for node in graph:
             for neighbor, weight in graph[node]:
                 if distances[node] + weight < distances[neighbor]:
                     distances[neighbor] = distances[node] + weight
+                    changed = True
+        if not changed:
+            return distances
 
     # Check for negative weight cycles
     for node in graph:
@@ -153,6 +816,139 @@ def bellman_ford(graph, start):
     return distances
 
 
+def _csr_bellman_ford(graph, start):
+    """Bellman-Ford over the flat arrays of a CSRGraph."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.num_nodes
+    distances = [float('inf')] * n
+    distances[graph.id_of(start)] = 0
+
+    def relax():
+        changed = False
+        for u in range(n):
+            du = distances[u]
+            if du == float('inf'):
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                if du + weights[e] < distances[targets[e]]:
+                    distances[targets[e]] = du + weights[e]
+                    changed = True
+        return changed
+
+    for _ in range(n - 1):
+        if not relax():
+            break
+    else:
+        if relax():
+            return None  # Negative weight cycle detected
+
+    return {graph.label_of(node): distance for node, distance in enumerate(distances)}
+
+
+def _spfa(edges, nodes, start):
+    """
+    Shortest Path Faster Algorithm: Bellman-Ford driven by a FIFO queue of the nodes
+    whose distance changed. A negative cycle is reported once some shortest path
+    would need |V| or more edges.
+    """
+    distances = {node: float('inf') for node in nodes}
+    distances[start] = 0
+    hops = {start: 0}  # Edges on the current shortest path to each node
+    queue = deque([start])
+    queued = {start}
+
+    while queue:
+        node = queue.popleft()
+        queued.discard(node)
+        for neighbor, weight in edges(node):
+            distance = distances[node] + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                hops[neighbor] = hops[node] + 1
+                if hops[neighbor] >= len(distances):
+                    return None  # Negative weight cycle detected
+                if neighbor not in queued:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+
+    return distances
+
+
+def _numpy_bellman_ford(graph, start):
+    """Bellman-Ford with each pass relaxing the whole CSR edge array at once."""
+    if np is None:
+        raise ImportError("bellman_ford(method='numpy') requires NumPy")
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph, weighted=True)
+    n = graph.num_nodes
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    targets = np.asarray(memoryview(graph.targets))
+    weights = np.asarray(memoryview(graph.weights))
+
+    distances = np.full(n, np.inf)
+    distances[graph.id_of(start)] = 0
+    for _ in range(n):
+        relaxed = distances.copy()
+        np.minimum.at(relaxed, targets, distances[sources] + weights)
+        if np.array_equal(relaxed, distances):
+            return {graph.label_of(node): float(d) for node, d in enumerate(distances)}
+        distances = relaxed
+    return None  # Still changing after |V| passes: negative weight cycle
+
+
+def find_negative_cycle(graph, start=None):
+    """
+    Finds a negative weight cycle with Bellman-Ford and predecessor tracking.
+    :param graph: Weighted adjacency list of the graph, or a weighted CSRGraph.
+    :param start: Only consider cycles reachable from start, or None for any cycle.
+    :return: List of nodes [v0, v1, ..., v0] following the cycle's edges, or None.
+    """
+    if isinstance(graph, CSRGraph):
+        cycle = _negative_cycle(_csr_edges(graph), range(graph.num_nodes),
+                                None if start is None else graph.id_of(start))
+        return [graph.label_of(node) for node in cycle] if cycle is not None else None
+    nodes = dict.fromkeys(graph)  # Ordered, with sink nodes appended
+    for edges in graph.values():
+        nodes.update((neighbor, None) for neighbor, _ in edges)
+    return _negative_cycle(lambda node: graph.get(node, ()), nodes, start)
+
+
+def _negative_cycle(edges, nodes, start):
+    """Bellman-Ford with predecessors over edges(node) -> (neighbor, weight) pairs."""
+    nodes = list(nodes)
+    if start is None:
+        distances = dict.fromkeys(nodes, 0)  # As if a virtual source reached every node
+    else:
+        distances = dict.fromkeys(nodes, float('inf'))
+        distances[start] = 0
+    parents = {}
+
+    for _ in range(len(nodes)):
+        last_relaxed = None
+        for node in nodes:
+            for neighbor, weight in edges(node):
+                if distances[node] + weight < distances[neighbor]:
+                    distances[neighbor] = distances[node] + weight
+                    parents[neighbor] = node
+                    last_relaxed = neighbor
+        if last_relaxed is None:
+            return None
+
+    # A node relaxed in pass |V| leads back into a cycle within |V| predecessor steps
+    node = last_relaxed
+    for _ in range(len(nodes)):
+        node = parents[node]
+    cycle = [node]
+    current = parents[node]
+    while current != node:
+        cycle.append(current)
+        current = parents[current]
+    cycle.append(node)
+    cycle.reverse()
+    return cycle
+
+
 # Test Cases
 if __name__ == "__main__":
     print("Bidirectional Search:")
@@ -169,6 +965,17 @@ if __name__ == "__main__":
 
     print("\nIterative Deepening Search:")
     print("Path from A to F:", iterative_deepening_search(graph, 'A', 'F'))  # Output: ['A', 'C', 'F']
+    print("Path from A to Z:", iterative_deepening_search(graph, 'A', 'Z'))  # Output: None
+
+    print("\nIDA* Search:")
+    heuristic = {'A': 5, 'B': 5, 'C': 3, 'D': 0, 'E': 0, 'F': 0}  # Admissible for goal D
+    ida_graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 6)],
+        'C': [('A', 4), ('B', 2), ('D', 3)],
+        'D': [('B', 6), ('C', 3)]
+    }
+    print("Path from A to D:", ida_star(ida_graph, 'A', 'D', heuristic))  # Output: ['A', 'B', 'C', 'D']
 
     print("\nDijkstra's Algorithm:")
     weighted_graph = {
@@ -178,6 +985,18 @@ if __name__ == "__main__":
         'D': [('B', 6), ('C', 3)]
     }
     print("Shortest paths from A:", dijkstra(weighted_graph, 'A'))  # Output: {'A': 0, 'B': 1, 'C': 3, 'D': 6}
+    csr_graph = CSRGraph.from_dict(weighted_graph)
+    print("Shortest paths from A (CSR):", dijkstra(csr_graph, 'A'))  # Output: {'A': 0, 'B': 1.0, 'C': 3.0, 'D': 6.0}
+    distances, predecessors = dijkstra(weighted_graph, 'A', targets='D', predecessors=True)
+    print("Route from A to D:", distances['D'], reconstruct_path(predecessors, 'D'))  # Output: 6 ['A', 'B', 'C', 'D']
+    context = SearchContext.for_thread(csr_graph)  # Reused by every query on this thread
+    print("Distance A to D (reused context):", dijkstra(csr_graph, 'A', targets='D', context=context)['D'])  # Output: 6.0
+    print("Bidirectional Dijkstra:", bidirectional_dijkstra(weighted_graph, 'A', 'D'))  # Output: (6, ['A', 'B', 'C', 'D'])
+    print("Distance matrix from A and D:", [[float(d) for d in row] for row in multi_source_dijkstra(csr_graph, ['A', 'D'], processes=2)])
+    # Output: [[0.0, 1.0, 3.0, 6.0], [6.0, 5.0, 3.0, 0.0]]
+    dynamic = DynamicShortestPaths(weighted_graph, 'A')
+    print("Nodes touched by B->C = 5:", dynamic.update_edge('B', 'C', 5))  # Output: 2
+    print("Route to D after the update:", dynamic.distance_to('D'), dynamic.path_to('D'))  # Output: 7 ['A', 'B', 'D']
 
     print("\nBellman-Ford Algorithm:")
     weighted_graph_negative = {
@@ -187,3 +1006,8 @@ if __name__ == "__main__":
         'D': []
     }
     print("Shortest paths from A:", bellman_ford(weighted_graph_negative, 'A'))  # Output: {'A': 0, 'B': 1, 'C': -2, 'D': 0}
+    print("Shortest paths from A (SPFA):", bellman_ford(weighted_graph_negative, 'A', method='spfa'))  # Output: {'A': 0, 'B': 1, 'C': -2, 'D': 0}
+    weighted_graph_negative['D'].append(('B', -2))
+    print("Negative cycle:", find_negative_cycle(weighted_graph_negative))  # Output: ['D', 'B', 'C', 'D']
+    print("Negative cycle (CSR):",
+          find_negative_cycle(CSRGraph.from_dict(weighted_graph_negative)))  # Output: ['D', 'B', 'C', 'D']
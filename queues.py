@@ -0,0 +1,216 @@
+import heapq
+
+
+# Priority Queues for Weighted Search
+#
+# Every queue supports the same decrease-key interface:
+#   push(item, priority)  inserts item, or lowers its priority if it is already queued
+#   pop()                 removes and returns (priority, item) with the lowest priority
+#   len(queue), item in queue
+# and records max_size, the largest number of entries it ever held.
+
+class HeapqQueue:
+    """
+    Binary heap from heapq with lazy deletion: decrease-key pushes a duplicate entry
+    and stale entries are skipped on pop, so the heap can grow to O(E) entries.
+    Time Complexity: O(log E) per push and pop
+    """
+    def __init__(self):
+        self._heap = []
+        self._priority = {}  # Current priority of every queued item
+        self.max_size = 0
+
+    def push(self, item, priority):
+        if item in self._priority and self._priority[item] <= priority:
+            return
+        self._priority[item] = priority
+        heapq.heappush(self._heap, (priority, item))
+        if len(self._heap) > self.max_size:
+            self.max_size = len(self._heap)
+
+    def pop(self):
+        while True:
+            priority, item = heapq.heappop(self._heap)
+            if self._priority.get(item) == priority:
+                del self._priority[item]
+                return priority, item
+
+    def __len__(self):
+        return len(self._priority)
+
+    def __contains__(self, item):
+        return item in self._priority
+
+
+class IndexedDaryHeap:
+    """
+    Indexed d-ary heap with true decrease-key: each item appears at most once and its
+    position is tracked, so the heap never holds more than V entries. A wider heap
+    (d = 4) is shallower, trading slightly more comparisons per pop for fewer levels
+    on the much more frequent decrease-key.
+    Time Complexity: O(log_d V) push/decrease-key, O(d log_d V) pop
+    """
+    def __init__(self, d=4):
+        self.d = d
+        self._items = []
+        self._priorities = []
+        self._position = {}
+        self.max_size = 0
+
+    def push(self, item, priority):
+        i = self._position.get(item)
+        if i is None:
+            i = len(self._items)
+            self._items.append(item)
+            self._priorities.append(priority)
+            self._position[item] = i
+            if i + 1 > self.max_size:
+                self.max_size = i + 1
+        elif priority < self._priorities[i]:
+            self._priorities[i] = priority
+        else:
+            return
+        self._sift_up(i)
+
+    def pop(self):
+        items, priorities = self._items, self._priorities
+        item, priority = items[0], priorities[0]
+        del self._position[item]
+        last_item, last_priority = items.pop(), priorities.pop()
+        if items:
+            items[0], priorities[0] = last_item, last_priority
+            self._position[last_item] = 0
+            self._sift_down(0)
+        return priority, item
+
+    def _sift_up(self, i):
+        items, priorities, position, d = self._items, self._priorities, self._position, self.d
+        item, priority = items[i], priorities[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if priorities[parent] <= priority:
+                break
+            items[i], priorities[i] = items[parent], priorities[parent]
+            position[items[i]] = i
+            i = parent
+        items[i], priorities[i] = item, priority
+        position[item] = i
+
+    def _sift_down(self, i):
+        items, priorities, position, d = self._items, self._priorities, self._position, self.d
+        n = len(items)
+        item, priority = items[i], priorities[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = min(range(first, min(first + d, n)), key=priorities.__getitem__)
+            if priorities[best] >= priority:
+                break
+            items[i], priorities[i] = items[best], priorities[best]
+            position[items[i]] = i
+            i = best
+        items[i], priorities[i] = item, priority
+        position[item] = i
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue for small non-negative integer priorities. The queued
+    priorities lie in [cursor, cursor + span], so span + 1 circular buckets suffice;
+    pop scans forward from the last popped priority. The span is the largest edge
+    weight in Dijkstra, plus the heuristic increase along an edge in A*; rather than
+    scanning the graph for it up front, the ring doubles whenever a push would wrap
+    onto a bucket still in use. Requires monotone pops, as in Dijkstra (or A* with a
+    consistent integer heuristic).
+    Time Complexity: O(1) amortized push/decrease-key, O(C) amortized pop (C = span)
+    """
+    def __init__(self, max_weight=63):
+        """:param max_weight: Expected span, used to size the initial ring of buckets."""
+        self._buckets = [set() for _ in range(int(max_weight) + 1)]
+        self._priority = {}
+        self._cursor = 0
+        self._high = 0  # Upper bound on the queued priorities
+        self.max_size = 0
+
+    def push(self, item, priority):
+        old = self._priority.get(item)
+        if old is not None and old <= priority:
+            return
+        if self._priority:
+            low, high = min(self._cursor, int(priority)), max(self._high, int(priority))
+        else:
+            low = high = int(priority)
+        if old is not None:
+            self._buckets[int(old) % len(self._buckets)].discard(item)
+        if high - low >= len(self._buckets):  # Would wrap onto a bucket still in use
+            self._grow(high - low + 1)
+        self._cursor, self._high = low, high  # Never scan past a smaller queued priority
+        self._priority[item] = priority
+        self._buckets[int(priority) % len(self._buckets)].add(item)
+        if len(self._priority) > self.max_size:
+            self.max_size = len(self._priority)
+
+    def _grow(self, span):
+        """Redistributes the queued items over at least span buckets."""
+        size = len(self._buckets)
+        while size < span:
+            size *= 2
+        buckets = [set() for _ in range(size)]
+        for item, priority in self._priority.items():
+            buckets[int(priority) % size].add(item)
+        self._buckets = buckets
+
+    def pop(self):
+        if not self._priority:
+            raise IndexError("pop from an empty BucketQueue")
+        buckets = self._buckets
+        while not buckets[self._cursor % len(buckets)]:
+            self._cursor += 1
+        item = buckets[self._cursor % len(buckets)].pop()
+        return self._priority.pop(item), item
+
+    def __len__(self):
+        return len(self._priority)
+
+    def __contains__(self, item):
+        return item in self._priority
+
+
+def make_queue(kind, max_weight=None):
+    """
+    Returns a new priority queue by name.
+    :param kind: 'heapq', 'dary' or 'bucket', or an existing queue object.
+    :param max_weight: Expected span of the bucket queue, if known; it grows as needed.
+    """
+    if not isinstance(kind, str):
+        return kind
+    if kind == 'heapq':
+        return HeapqQueue()
+    if kind == 'dary':
+        return IndexedDaryHeap()
+    if kind == 'bucket':
+        return BucketQueue() if max_weight is None else BucketQueue(max_weight)
+    raise ValueError(f"unknown priority queue: {kind!r}")
+
+
+# Test Cases
+if __name__ == "__main__":
+    for queue in (HeapqQueue(), IndexedDaryHeap(), BucketQueue(max_weight=10)):
+        queue.push('a', 5)
+        queue.push('b', 3)
+        queue.push('c', 9)
+        queue.push('c', 4)  # Decrease-key
+        order = [queue.pop() for _ in range(len(queue))]
+        print(f"{type(queue).__name__}:", order)  # Output: [(3, 'b'), (4, 'c'), (5, 'a')]
+
+    small = BucketQueue(max_weight=2)
+    for item, priority in (('a', 0), ('b', 3), ('c', 9)):  # Spans wider than 2 grow the ring
+        small.push(item, priority)
+    print("Grown BucketQueue:", [small.pop() for _ in range(len(small))])  # Output: [(0, 'a'), (3, 'b'), (9, 'c')]
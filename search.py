@@ -1,4 +1,21 @@
 import math
+import mmap
+import os
+import struct
+import tempfile
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import partial
+from numbers import Number
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch searches fall back to bisect
+    np = None
+
+from storage import atomic_write
 
 
 # Linear Search
@@ -21,7 +38,7 @@ def linear_search(arr, target):
 
 
 # Binary Search
-def binary_search(arr, target):
+def binary_search(arr, target, left=0, right=None):
     """
     Binary Search Algorithm
     -----------------------
@@ -34,8 +51,11 @@ def binary_search(arr, target):
     Use Case:
         - Requires the array to be sorted
         - Highly efficient for large datasets
+        - Optional left/right bounds restrict the search to arr[left:right + 1]
+          without copying
     """
-    left, right = 0, len(arr) - 1
+    if right is None:
+        right = len(arr) - 1
     while left <= right:
         mid = (left + right) // 2
         if arr[mid] == target:
@@ -47,6 +67,75 @@ def binary_search(arr, target):
     return -1
 
 
+# Batched Binary Search
+def _as_numpy(values):
+    """Views a NumPy array, array.array or other buffer as an ndarray without copying."""
+    if isinstance(values, np.ndarray):
+        return values
+    try:
+        return np.asarray(memoryview(values))
+    except TypeError:
+        return np.asarray(values)
+
+
+def batch_lower_bound(arr, targets):
+    """
+    Batched Lower Bound
+    -------------------
+    Time Complexity: O(k log n) (k = number of targets)
+    Space Complexity: O(k)
+    Use Case:
+        - For every target, the first index i with arr[i] >= target
+        - Vectorized with NumPy's searchsorted; falls back to bisect without NumPy
+    """
+    if np is not None:
+        return np.searchsorted(_as_numpy(arr), _as_numpy(targets), side='left')
+    return array('q', [bisect_left(arr, target) for target in targets])
+
+
+def batch_upper_bound(arr, targets):
+    """
+    Batched Upper Bound
+    -------------------
+    Time Complexity: O(k log n) (k = number of targets)
+    Space Complexity: O(k)
+    Use Case:
+        - For every target, the first index i with arr[i] > target
+        - Vectorized with NumPy's searchsorted; falls back to bisect without NumPy
+    """
+    if np is not None:
+        return np.searchsorted(_as_numpy(arr), _as_numpy(targets), side='right')
+    return array('q', [bisect_right(arr, target) for target in targets])
+
+
+def batch_binary_search(arr, targets):
+    """
+    Batched Binary Search
+    ---------------------
+    Time Complexity: O(k log n) (k = number of targets)
+    Space Complexity: O(k)
+    Use Case:
+        - Resolves many targets against the same sorted array in one call
+        - Returns an index array with -1 for missing targets, like binary_search
+        - Duplicates resolve to their leftmost index
+    """
+    if np is not None:
+        arr = _as_numpy(arr)
+        targets = _as_numpy(targets)
+        if len(arr) == 0:
+            return np.full(len(targets), -1, dtype=np.intp)
+        idx = np.searchsorted(arr, targets, side='left')
+        found = arr[np.minimum(idx, len(arr) - 1)] == targets
+        return np.where(found, idx, -1)
+
+    n = len(arr)
+    result = array('q', [0]) * len(targets)
+    for k, target in enumerate(targets):
+        i = bisect_left(arr, target)
+        result[k] = i if i < n and arr[i] == target else -1
+    return result
+
+
 # Jump Search
 def jump_search(arr, target):
     """
@@ -89,14 +178,82 @@ def exponential_search(arr, target):
         - Works well on sorted data
         - Suitable for unbounded or infinite arrays
     """
+    n = len(arr)
+    if n == 0:
+        return -1
     if arr[0] == target:
         return 0
-    n = len(arr)
     i = 1
     while i < n and arr[i] <= target:
         i *= 2
-    # Binary search in the found range
-    return binary_search(arr[:min(i, n)], target)
+    # Binary search in the found range, in place rather than on a slice
+    return binary_search(arr, target, i // 2, min(i, n - 1))
+
+
+# Galloping Search
+class GallopingSearch:
+    """
+    Galloping (Exponential) Search Cursor
+    -------------------------------------
+    Time Complexity:
+        Per Query: O(log d) (d = distance from the previous position)
+        Sorted Stream of k Targets: O(k log(n/k)) in total
+    Space Complexity: O(1)
+    Use Case:
+        - Resolves a sorted stream of targets, resuming from the previous hit
+        - Intersecting and merging sorted ID lists
+    """
+    def __init__(self, arr):
+        self.arr = arr
+        self.position = 0
+
+    def lower_bound(self, target):
+        """Returns the first index i with arr[i] >= target, galloping from the last position."""
+        arr, n = self.arr, len(self.arr)
+        lo = self.position
+        if lo < n and arr[lo] < target:
+            # Gallop forward until arr[hi] >= target
+            step = 1
+            hi = lo + 1
+            while hi < n and arr[hi] < target:
+                lo = hi
+                step *= 2
+                hi = lo + step
+            lo, hi = lo + 1, min(hi, n)
+        else:
+            # Gallop backward until arr[lo] < target
+            hi = min(lo, n)
+            step = 1
+            lo = hi - 1
+            while lo >= 0 and arr[lo] >= target:
+                hi = lo
+                step *= 2
+                lo = hi - step
+            lo = max(lo + 1, 0)
+        self.position = bisect_left(arr, target, lo, hi)
+        return self.position
+
+    def search(self, target):
+        """Returns the index of target, or -1 if not found."""
+        i = self.lower_bound(target)
+        if i < len(self.arr) and self.arr[i] == target:
+            return i
+        return -1
+
+
+def intersect_sorted(a, b):
+    """
+    Sorted List Intersection
+    ------------------------
+    Time Complexity: O(k log(n/k)) (k = len of the shorter list, n = the longer)
+    Space Complexity: O(k)
+    Use Case:
+        - Intersects two sorted lists by galloping through the longer one
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    cursor = GallopingSearch(b)
+    return [x for x in a if cursor.search(x) != -1]
 
 
 # Ternary Search
@@ -132,6 +289,325 @@ def ternary_search(arr, target, left, right):
     return -1
 
 
+# Interpolation Search
+_LINEAR_CUTOFF = 16  # Ranges this small are scanned faster than they are bisected
+
+
+def interpolation_search(arr, target, left=0, right=None, guarded=False):
+    """
+    Interpolation Search Algorithm
+    ------------------------------
+    Time Complexity:
+        Average Case: O(log log n) (uniformly distributed keys)
+        Worst Case: O(n) (skewed keys), or O(log n) with guarded=True
+    Space Complexity: O(1)
+    Use Case:
+        - Requires the array to be sorted and numeric
+        - Probes where the target should lie if the keys were evenly spread
+        - guarded=True bisects whenever a probe fails to halve the range and
+          finishes small ranges with a linear scan, bounding skewed inputs
+    """
+    if right is None:
+        right = len(arr) - 1
+    interpolate = True
+    while left <= right:
+        low, high = arr[left], arr[right]
+        if target < low or target > high:
+            return -1
+        width = right - left
+        if guarded and width < _LINEAR_CUTOFF:
+            for i in range(left, right + 1):
+                if arr[i] >= target:
+                    return i if arr[i] == target else -1
+            return -1
+        if low == high:
+            return left  # low <= target <= high, so every key equals the target
+        if interpolate:
+            pos = left + int((target - low) * width // (high - low))
+        else:
+            pos = (left + right) // 2
+        value = arr[pos]
+        if value == target:
+            return pos
+        elif value < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+        if guarded:
+            interpolate = right - left <= width // 2
+    return -1
+
+
+# Adaptive Search
+ADAPTIVE_CACHE_SIZE = 32  # Number of arrays whose choice adaptive_search remembers
+_adaptive_searches = OrderedDict()  # id(arr) -> (weak reference or arr, length, algorithm)
+
+
+class AdaptiveSearch:
+    """
+    Adaptive Search
+    ---------------
+    Time Complexity:
+        Profiling: O(s) once per array (s = sample size)
+        Search: that of the chosen algorithm
+    Space Complexity: O(1)
+    Use Case:
+        - Sorted arrays whose size and key distribution are not known in advance
+        - Samples the keys once and picks linear search (tiny arrays), guarded
+          interpolation (near-uniform or mildly skewed numeric keys) or binary
+          search (heavily skewed or non-numeric keys)
+        - A sample cannot rule out local clusters, so plain interpolation (O(n) on
+          clustered keys) is only chosen with guarded=False
+    """
+    _ALGORITHMS = {
+        'linear': linear_search,
+        'interpolation': interpolation_search,
+        'guarded': partial(interpolation_search, guarded=True),
+        'binary': binary_search,
+    }
+
+    def __init__(self, arr, sample_size=64, guarded=True):
+        """
+        :param arr: Sorted sequence (list, array.array or NumPy array).
+        :param sample_size: Number of evenly spaced keys used to measure the skew.
+        :param guarded: Use guarded interpolation even for keys that look uniform.
+        """
+        self.arr = arr
+        self.n = len(arr)
+        self._keys = self._search_keys(arr)
+        self.skew = self._measure_skew(sample_size)
+        if self.n <= _LINEAR_CUTOFF:
+            self.algorithm = 'linear'
+        elif self.skew < 0.01 and not guarded:
+            self.algorithm = 'interpolation'
+        elif self.skew < 0.25:
+            self.algorithm = 'guarded'
+        else:
+            self.algorithm = 'binary'
+        self._search = partial(self._ALGORITHMS[self.algorithm], self._keys)
+
+    @staticmethod
+    def _search_keys(arr):
+        """NumPy scalars overflow in the interpolation arithmetic; memoryviews yield ints."""
+        if np is not None and isinstance(arr, np.ndarray) and arr.ndim == 1 and arr.flags.c_contiguous:
+            return memoryview(arr)
+        return arr
+
+    def _measure_skew(self, sample_size):
+        """
+        Largest distance, as a fraction of n, between a sampled key's index and the
+        index linear interpolation between the first and last keys predicts for it
+        (0 for evenly spaced keys, inf when the keys cannot be interpolated).
+        """
+        keys, n = self._keys, self.n
+        if n < 2:
+            return 0.0
+        low, high = keys[0], keys[n - 1]
+        if not all(isinstance(key, Number) and not isinstance(key, bool) for key in (low, high)):
+            return float('inf')
+        if high == low:
+            return 0.0
+        skew = 0.0
+        for i in range(0, n, max(1, n // sample_size)):
+            predicted = (keys[i] - low) * (n - 1) / (high - low)
+            skew = max(skew, abs(predicted - i) / n)
+        return skew
+
+    def search(self, target):
+        """Returns the index of target using the chosen algorithm, or -1 if not found."""
+        return self._search(target)
+
+
+def _forget_adaptive(key, ref):
+    """Drops the cached choice of a collected array, unless its id was reused."""
+    if _adaptive_searches.get(key, (None,))[0] is ref:
+        del _adaptive_searches[key]
+
+
+def adaptive_search(arr, target):
+    """
+    Adaptive ("auto") Search
+    ------------------------
+    Time Complexity: that of the algorithm AdaptiveSearch picks for arr
+    Space Complexity: O(1) per cached array
+    Use Case:
+        - Drop-in replacement for binary_search that profiles each array once and
+          caches the choice for the ADAPTIVE_CACHE_SIZE most recently used arrays
+        - Arrays that support weak references (array.array, NumPy arrays) are not
+          kept alive by the cache; lists and tuples are held until evicted
+        - The choice is redone when the array's length changes; rebuild an
+          AdaptiveSearch yourself if the keys change in place
+    """
+    key = id(arr)
+    entry = _adaptive_searches.get(key)
+    if entry is not None:
+        anchor, n, algorithm = entry
+        if isinstance(anchor, weakref.ref):
+            anchor = anchor()
+        if anchor is not arr or n != len(arr):
+            entry = None
+    if entry is None:
+        algorithm = AdaptiveSearch(arr).algorithm
+        try:
+            anchor = weakref.ref(arr, partial(_forget_adaptive, key))
+        except TypeError:
+            anchor = arr
+        _adaptive_searches[key] = (anchor, len(arr), algorithm)
+        while len(_adaptive_searches) > ADAPTIVE_CACHE_SIZE:
+            _adaptive_searches.popitem(last=False)
+    else:
+        _adaptive_searches.move_to_end(key)
+    return AdaptiveSearch._ALGORITHMS[algorithm](AdaptiveSearch._search_keys(arr), target)
+
+
+# Eytzinger Layout Search
+def _subtree_sizes(nodes, n):
+    """Vectorized sizes of the subtrees rooted at BFS positions nodes in an n-node Eytzinger tree."""
+    sizes = np.zeros(len(nodes), dtype=np.int64)
+    first, last = nodes.copy(), nodes.copy()
+    while True:
+        count = np.minimum(last, n) - first + 1
+        if not (count > 0).any():
+            return sizes
+        sizes += np.maximum(count, 0)
+        first, last = 2 * first, 2 * last + 1
+
+
+def _eytzinger_ranks(n):
+    """Returns ranks[k] = sorted index of the key stored at BFS position k (ranks[0] is unused)."""
+    if np is not None:
+        ranks = np.zeros(n + 1, dtype=np.int64)
+        if n == 0:
+            return ranks
+        ranks[1] = _subtree_sizes(np.array([2]), n)[0]
+        level = np.array([1], dtype=np.int64)
+        while True:
+            left, right = 2 * level, 2 * level + 1
+            has_left, has_right = left <= n, right <= n
+            if not has_left.any():
+                return ranks
+            ranks[left[has_left]] = ranks[level[has_left]] - _subtree_sizes(2 * left[has_left] + 1, n) - 1
+            ranks[right[has_right]] = ranks[level[has_right]] + _subtree_sizes(2 * right[has_right], n) + 1
+            level = np.concatenate((left[has_left], right[has_right]))
+
+    # Iterative in-order walk over the implicit tree
+    ranks = array('q', [0]) * (n + 1)
+    stack, k, i = [], 1, 0
+    while stack or k <= n:
+        while k <= n:
+            stack.append(k)
+            k *= 2
+        k = stack.pop()
+        ranks[k] = i
+        i += 1
+        k = 2 * k + 1
+    return ranks
+
+
+def _key_typecode(keys):
+    """Returns 'q' for 64-bit integer keys, 'd' for real keys with a float, else None."""
+    if np is not None and isinstance(keys, np.ndarray):
+        return {'b': 'q', 'i': 'q', 'u': 'q', 'f': 'd'}.get(keys.dtype.kind)
+    if isinstance(keys, array):
+        return 'd' if keys.typecode in 'fd' else 'q'
+    has_float = False
+    for key in keys:
+        if isinstance(key, float):
+            has_float = True
+        elif not isinstance(key, int) or not -2 ** 63 <= key < 2 ** 63:
+            return None
+    return 'd' if has_float else 'q'
+
+
+class EytzingerArray:
+    """
+    Eytzinger (BFS Order) Layout Search
+    -----------------------------------
+    Time Complexity:
+        Build: O(n)
+        Search: O(log n) with one comparison per level
+    Space Complexity: O(n)
+    Use Case:
+        - Static sorted arrays queried many times
+        - Stores the keys in breadth-first order of an implicit binary tree, so
+          the first levels of every search share a few cache lines and each
+          probe's children sit next to each other
+        - Results are indices into the original sorted list, like binary_search
+    """
+    def __init__(self, sorted_keys, typecode='auto'):
+        """
+        Builds the layout once from sorted keys.
+        :param sorted_keys: Sorted sequence of keys.
+        :param typecode: array typecode for the compact key buffer, None to keep
+                         arbitrary comparable keys in a list, or 'auto' to pick 'q' for
+                         integer keys, 'd' when any key is a float and a list otherwise.
+        """
+        n = self.n = len(sorted_keys)
+        ranks = _eytzinger_ranks(n)
+        if typecode == 'auto':
+            typecode = _key_typecode(sorted_keys)
+        if np is not None and typecode is not None:
+            keys = np.zeros(n + 1, dtype=np.dtype(typecode))
+            source = _as_numpy(sorted_keys)[ranks[1:]]
+            keys[1:] = source
+            if not np.array_equal(keys[1:], source):  # e.g. float keys in an integer buffer
+                raise TypeError(f"keys do not fit typecode {typecode!r}")
+            self.keys, self.ranks = keys, ranks
+            self._np_keys = keys
+        else:
+            keys = [sorted_keys[0] if n else 0] * (n + 1)
+            for k in range(1, n + 1):
+                keys[k] = sorted_keys[ranks[k]]
+            self.keys = array(typecode, keys) if typecode is not None else keys
+            self.ranks = ranks
+            self._np_keys = None
+        # memoryviews keep per-query indexing free of NumPy scalar overhead without copying
+        self._keys = memoryview(self.keys) if self._np_keys is not None else self.keys
+        self._ranks = memoryview(ranks) if np is not None else ranks
+
+    def __len__(self):
+        return self.n
+
+    def _descend(self, target):
+        """Returns the BFS position of the first key >= target, or 0 if there is none."""
+        keys, n, k = self._keys, self.n, 1
+        while k <= n:
+            k = 2 * k + (keys[k] < target)
+        # Undo the trailing right turns (and the final left turn) to reach the answer
+        return k >> (~k & (k + 1)).bit_length()
+
+    def lower_bound(self, target):
+        """Returns the sorted index of the first key >= target."""
+        k = self._descend(target)
+        return self._ranks[k] if k else self.n
+
+    def search(self, target):
+        """Returns the sorted index of target, or -1 if not found."""
+        k = self._descend(target)
+        if k and self._keys[k] == target:
+            return self._ranks[k]
+        return -1
+
+    def batch_search(self, targets):
+        """
+        Resolves many targets at once, like batch_binary_search.
+        :param targets: NumPy array, array.array, buffer or list of targets.
+        :return: Index array with -1 for missing targets.
+        """
+        if self._np_keys is None:
+            return array('q', [self.search(target) for target in targets])
+        targets = _as_numpy(targets)
+        keys, n = self._np_keys, self.n
+        k = np.ones(len(targets), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            active = k <= n
+            step = 2 * k + (keys[np.minimum(k, n)] < targets)
+            k = np.where(active, step, k)
+        k //= 2 * ((k + 1) & ~k)
+        found = (k > 0) & (keys[k] == targets)
+        return np.where(found, self.ranks[k], -1)
+
+
 # Hash Table Implementation for Search
 class HashTable:
     """
@@ -147,12 +623,320 @@ class HashTable:
     """
     def __init__(self):
         self.table = {}
+        self.version = 0  # Bumped on every mutation so caches can detect changes
 
     def insert(self, key, value):
         self.table[key] = value
+        self.version += 1
 
-    def search(self, key):
-        return self.table.get(key, -1)  # Return -1 if key not found
+    def search(self, key, default=-1):
+        return self.table.get(key, default)  # Return default (-1) if key not found
+
+
+# Array-Backed Hash Table
+_EMPTY, _DELETED = 0, 1  # Control bytes; full slots hold 0x80 | 7 bits of the hash
+_FIBONACCI = 0x9E3779B97F4A7C15  # 2^64 / golden ratio, for multiplicative hashing
+_MASK64 = (1 << 64) - 1
+
+
+class ArrayHashTable:
+    """
+    Open-Addressing Hash Table
+    --------------------------
+    Time Complexity:
+        Average Case: O(1) per insert, search and delete
+        Bulk: insert_many/search_many probe all keys at once with NumPy
+    Space Complexity: O(capacity): one control byte plus one fixed-width key and
+                      value per slot (17 bytes for int64 keys and values)
+    Use Case:
+        - Millions of integer keys with fixed-width values, where a dict costs
+          around 100 bytes per entry
+        - SwissTable-style layout: linear probing over flat array buffers, with a
+          control byte per slot (empty, deleted or 7 bits of the key's hash) so
+          most mismatches are rejected without comparing keys
+        - Deletes leave tombstones, which are purged when the table is rebuilt
+        - save() and load() map the table from disk without rebuilding it
+    """
+    _HEADER = struct.Struct('=4scc2x3q')  # magic, key and value typecodes, capacity, size, tombstones
+    _MAGIC = b'AHT1'
+
+    def __init__(self, capacity=8, key_typecode='q', value_typecode='q'):
+        """
+        :param capacity: Initial number of entries to make room for.
+        :param key_typecode: Integer array typecode of the keys.
+        :param value_typecode: array typecode of the values ('q', 'd', ...).
+        """
+        self.key_typecode, self.value_typecode = key_typecode, value_typecode
+        self.size = 0
+        self.version = 0  # Bumped on every mutation so caches can detect changes
+        self._mmap = None
+        slots = 8
+        while slots * 7 < capacity * 8:
+            slots *= 2
+        self._allocate(slots)
+
+    def _allocate(self, slots):
+        self.capacity = slots
+        self._mask = slots - 1
+        self._shift = 64 - (slots.bit_length() - 1)
+        self._deleted = 0
+        self.control = bytearray(slots)
+        self.keys = array(self.key_typecode, [0]) * slots
+        self.values = array(self.value_typecode, [0]) * slots
+
+    def __len__(self):
+        return self.size
+
+    def _slot_and_tag(self, key):
+        h = ((key & _MASK64) * _FIBONACCI) & _MASK64
+        return h >> self._shift, 0x80 | (h & 0x7F)
+
+    def _find(self, key):
+        """Returns the slot holding key, or -1."""
+        slot, tag = self._slot_and_tag(key)
+        control, keys, mask = self.control, self.keys, self._mask
+        while True:
+            c = control[slot]
+            if c == _EMPTY:
+                return -1
+            if c == tag and keys[slot] == key:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _reserve(self, count):
+        """Rebuilds the table if count more entries would exceed a 7/8 load factor."""
+        if (self.size + self._deleted + count) * 8 <= self.capacity * 7:
+            return
+        slots = self.capacity
+        while (self.size + count) * 2 > slots:  # Rebuild at most half full
+            slots *= 2
+        self._rebuild(slots)
+
+    def _rebuild(self, slots):
+        if np is not None:
+            control, keys, values = self._np_tables()
+            live = np.flatnonzero(control & 0x80)
+            old_keys, old_values = keys[live], values[live]  # Fancy indexing copies
+            del control, keys, values  # Drop the buffer exports before unmapping
+        else:
+            live = [slot for slot in range(self.capacity) if self.control[slot] & 0x80]
+            old_keys = [self.keys[slot] for slot in live]
+            old_values = [self.values[slot] for slot in live]
+        self._release()
+        self._allocate(slots)
+        self.size = 0
+        self._place(old_keys, old_values)
+
+    def insert(self, key, value):
+        slot = self._find(key)
+        if slot == -1:
+            self._reserve(1)
+            slot, tag = self._slot_and_tag(key)
+            control, mask = self.control, self._mask
+            while control[slot] & 0x80:
+                slot = (slot + 1) & mask
+            if control[slot] == _DELETED:
+                self._deleted -= 1
+            control[slot] = tag
+            self.keys[slot] = key
+            self.size += 1
+        self.values[slot] = value
+        self.version += 1
+
+    def search(self, key, default=-1):
+        """Returns the value stored for key, or default (-1) if key is not found."""
+        slot = self._find(key)
+        return self.values[slot] if slot != -1 else default
+
+    def get(self, key, default=None):
+        return self.search(key, default)
+
+    def __contains__(self, key):
+        return self._find(key) != -1
+
+    def __getitem__(self, key):
+        slot = self._find(key)
+        if slot == -1:
+            raise KeyError(key)
+        return self.values[slot]
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def delete(self, key):
+        """Removes key, leaving a tombstone. Returns whether it was present."""
+        slot = self._find(key)
+        if slot == -1:
+            return False
+        self.control[slot] = _DELETED
+        self.size -= 1
+        self._deleted += 1
+        self.version += 1
+        return True
+
+    def items(self):
+        """Yields the (key, value) pairs in slot order."""
+        for slot in range(self.capacity):
+            if self.control[slot] & 0x80:
+                yield self.keys[slot], self.values[slot]
+
+    # Bulk operations
+    def _np_slots_and_tags(self, keys):
+        h = keys.astype(np.uint64) * np.uint64(_FIBONACCI)  # Wraps modulo 2^64
+        slots = (h >> np.uint64(self._shift)).astype(np.intp)
+        tags = ((h & np.uint64(0x7F)) | np.uint64(0x80)).astype(np.uint8)
+        return slots, tags
+
+    def _np_tables(self):
+        return (np.frombuffer(self.control, dtype=np.uint8),
+                np.frombuffer(self.keys, dtype=np.dtype(self.key_typecode)),
+                np.frombuffer(self.values, dtype=np.dtype(self.value_typecode)))
+
+    def _np_find(self, keys):
+        """Vectorized _find: probes every key one step per round."""
+        control, table_keys, _ = self._np_tables()
+        slots, tags = self._np_slots_and_tags(keys)
+        found = np.full(len(keys), -1, dtype=np.intp)
+        active = np.arange(len(keys))
+        while active.size:
+            probe = slots[active]
+            c = control[probe]
+            hit = (c == tags[active]) & (table_keys[probe] == keys[active])
+            found[active[hit]] = probe[hit]
+            active = active[~(hit | (c == _EMPTY))]
+            slots[active] = (slots[active] + 1) & self._mask
+        return found
+
+    def _place(self, keys, values):
+        """Inserts keys known to be absent (and distinct); room must be reserved."""
+        if np is None:
+            for key, value in zip(keys, values):
+                self.insert(key, value)
+            return
+        keys, values = np.asarray(keys), np.asarray(values)
+        control, table_keys, table_values = self._np_tables()
+        slots, tags = self._np_slots_and_tags(keys)
+        placed = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        while pending.size:
+            probe = slots[pending]
+            free = control[probe] < 0x80
+            # Keys competing for the same free slot: the first one claims it
+            claim, first = np.unique(probe[free], return_index=True)
+            winners = pending[free][first]
+            self._deleted -= int(np.count_nonzero(control[claim] == _DELETED))
+            control[claim] = tags[winners]
+            table_keys[claim] = keys[winners]
+            table_values[claim] = values[winners]
+            placed[winners] = True
+            blocked = pending[~free]
+            slots[blocked] = (slots[blocked] + 1) & self._mask
+            pending = pending[~placed[pending]]
+        self.size += len(keys)
+
+    def insert_many(self, keys, values):
+        """
+        Inserts or updates many entries; later duplicates win, as with repeated insert.
+        :param keys: Sequence or array of integer keys.
+        :param values: Sequence or array of values, parallel to keys.
+        """
+        if np is None:
+            for key, value in zip(keys, values):
+                self.insert(key, value)
+            return
+        keys = np.asarray(keys, dtype=np.dtype(self.key_typecode))
+        values = np.asarray(values, dtype=np.dtype(self.value_typecode))
+        if len(keys) == 0:
+            return
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = len(keys) - 1 - last
+        keys, values = keys[keep], values[keep]
+        found = self._np_find(keys)
+        present = found != -1
+        self._np_tables()[2][found[present]] = values[present]
+        self._reserve(int(np.count_nonzero(~present)))
+        self._place(keys[~present], values[~present])
+        self.version += 1
+
+    def search_many(self, keys, default=-1):
+        """
+        Looks up many keys at once.
+        :param keys: Sequence or array of integer keys.
+        :param default: Value reported for missing keys.
+        :return: Values parallel to keys (a NumPy array, or an array.array without NumPy).
+        """
+        if np is None:
+            return array(self.value_typecode, [self.search(key, default) for key in keys])
+        keys = np.asarray(keys, dtype=np.dtype(self.key_typecode))
+        found = self._np_find(keys)
+        result = np.full(len(keys), default, dtype=np.dtype(self.value_typecode))
+        present = found != -1
+        result[present] = self._np_tables()[2][found[present]]
+        return result
+
+    def contains_many(self, keys):
+        """:return: Boolean mask (or list without NumPy) of which keys are present."""
+        if np is None:
+            return [key in self for key in keys]
+        return self._np_find(np.asarray(keys, dtype=np.dtype(self.key_typecode))) != -1
+
+    # Persistence
+    def save(self, path):
+        """
+        Writes a header (typecodes, capacity, size, tombstones), the control bytes, then
+        the key and value slots in probe order, so load() needs no rehashing.
+        """
+        with atomic_write(path) as f:
+            f.write(self._HEADER.pack(self._MAGIC, self.key_typecode.encode(),
+                                      self.value_typecode.encode(), self.capacity,
+                                      self.size, self._deleted))
+            f.write(self.control)
+            for buffer in (self.keys, self.values):
+                f.write(memoryview(buffer).cast('B'))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Maps a saved table without reading or rehashing it: startup cost is
+        independent of its size. Writes stay private to this process.
+        :param path: Path written by save().
+        :return: A new ArrayHashTable.
+        """
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, key_typecode, value_typecode, slots, size, deleted = cls._HEADER.unpack_from(buffer)
+        if magic != cls._MAGIC:
+            buffer.close()
+            raise ValueError(f"{path} is not a saved ArrayHashTable")
+        table = cls.__new__(cls)
+        table.key_typecode, table.value_typecode = key_typecode.decode(), value_typecode.decode()
+        table.capacity, table.size, table._deleted = slots, size, deleted
+        table._mask = slots - 1
+        table._shift = 64 - (slots.bit_length() - 1)
+        table.version = 0
+        view = memoryview(buffer)
+        offset = cls._HEADER.size
+        table.control = view[offset:offset + slots]
+        offset += slots
+        key_bytes = slots * array(table.key_typecode).itemsize
+        table.keys = view[offset:offset + key_bytes].cast(table.key_typecode)
+        offset += key_bytes
+        value_bytes = slots * array(table.value_typecode).itemsize
+        table.values = view[offset:offset + value_bytes].cast(table.value_typecode)
+        view.release()
+        table._mmap = buffer
+        return table
+
+    def _release(self):
+        if self._mmap is not None:
+            for view in (self.control, self.keys, self.values):
+                view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self):
+        """Releases the memory map of a loaded table; the table must not be used afterwards."""
+        self._release()
 
 
 # Test the Search Algorithms
@@ -165,6 +949,14 @@ if __name__ == "__main__":
     print("Jump Search:", jump_search(arr, 5))     # Output: 4
     print("Exponential Search:", exponential_search(arr, 5))  # Output: 4
     print("Ternary Search:", ternary_search(arr, 5, 0, len(arr) - 1))  # Output: 4
+    print("Interpolation Search:", interpolation_search(arr, 5))  # Output: 4
+    uniform = list(range(0, 10**6, 3))
+    print("Adaptive Search:", adaptive_search(arr, 5), AdaptiveSearch(uniform).algorithm)  # Output: 4 guarded
+    print("Unguarded choice:", AdaptiveSearch(uniform, guarded=False).algorithm)  # Output: interpolation
+    print("Eytzinger Search:", EytzingerArray(arr).search(5))  # Output: 4
+    print("Eytzinger Float Keys:", EytzingerArray([1.5, 2.5, 3.5]).search(2.5))  # Output: 1
+    print("Sorted Intersection:", intersect_sorted([1, 3, 5, 7], arr))  # Output: [1, 3, 5, 7]
+    print("Batch Binary Search:", batch_binary_search(arr, [5, 1, 10]).tolist())  # Output: [4, 0, -1]
 
     # Hash Table Test
     hash_table = HashTable()
@@ -172,3 +964,21 @@ if __name__ == "__main__":
     hash_table.insert('banana', 2)
     print("Hash Table Search:", hash_table.search('apple'))  # Output: 1
     print("Hash Table Search (not found):", hash_table.search('grape'))  # Output: -1
+    print("Missing key:", hash_table.search('cherry', default=None))  # Output: None
+
+    # Array-Backed Hash Table Test
+    int_table = ArrayHashTable()
+    int_table.insert_many(range(0, 1000, 10), range(100))
+    int_table.delete(20)
+    print("Array Hash Table Search:", int_table.search(990), int_table.get(20))  # Output: 99 None
+    print("Bulk lookup:", [int(v) for v in int_table.search_many([10, 20, 30])])  # Output: [1, -1, 3]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'table.bin')
+        int_table.save(path)
+        loaded = ArrayHashTable.load(path)
+        loaded.insert(20, 2)
+        loaded.save(path)  # Overwrites the file the table is still mapped from
+        loaded.close()
+        reloaded = ArrayHashTable.load(path)
+        print("Saved in place:", reloaded.get(20), len(reloaded))  # Output: 2 100
+        reloaded.close()
@@ -1,4 +1,14 @@
 import heapq
+import mmap
+import random
+import struct
+from array import array
+
+from csr import CSRGraph
+from other import _csr_distances, _csr_edges
+from queues import make_queue
+from storage import atomic_write
+from strings import KMPPattern, compile_kmp
 
 
 # A* Search Algorithm
@@ -6,26 +16,66 @@ class AStar:
     def __init__(self, graph, heuristic):
         """
         Initializes the A* Search algorithm.
-        :param graph: Dictionary representing the adjacency list of the graph.
-        :param heuristic: Dictionary of heuristic costs for each node.
+        :param graph: Dictionary representing the adjacency list of the graph, a CSRGraph,
+                      or an ImplicitGraph whose states are generated on demand.
+        :param heuristic: Dictionary of heuristic costs for each node, or a callable
+                          heuristic(node, goal) such as an ALTHeuristic.
         """
         self.graph = graph
         self.heuristic = heuristic
 
-    def search(self, start, goal):
+    def _estimator(self, goal, ids=False):
+        """
+        Returns h(node) for one query, caching callable estimates per node.
+        :param ids: Whether nodes are CSR node ids rather than node keys.
+        """
+        heuristic, graph = self.heuristic, self.graph
+        if isinstance(heuristic, dict):
+            if ids:
+                return lambda node: heuristic[graph.label_of(node)]
+            return heuristic.__getitem__
+        if isinstance(heuristic, ALTHeuristic) and heuristic.graph is graph and ids:
+            estimate, goal = heuristic.bound, graph.id_of(goal)
+        elif ids:
+            estimate = lambda node, goal: heuristic(graph.label_of(node), goal)
+        else:
+            estimate = heuristic
+
+        cache = {}
+
+        def h(node):
+            value = cache.get(node)
+            if value is None:
+                value = cache[node] = estimate(node, goal)
+            return value
+        return h
+
+    def search(self, start, goal, context=None, queue='heapq'):
         """
         Performs the A* search algorithm to find the shortest path.
+        Scores are kept in dicts that only hold the nodes the search reaches.
         :param start: Starting node.
         :param goal: Goal node.
+        :param context: Optional SearchContext to reuse across queries on a CSRGraph.
+        :param queue: Priority queue backend: 'heapq', 'dary', 'bucket' (integer weights
+                      and a consistent integer heuristic) or a queue object from the
+                      queues module.
         :return: List representing the path from start to goal, or None if no path exists.
         """
+        if context is not None:
+            if not isinstance(self.graph, CSRGraph):
+                raise TypeError("search contexts require a CSRGraph")
+            return self._search_context(start, goal, context)
+        if queue != 'heapq':
+            return self._search_queue(start, goal, make_queue(queue))
+        if isinstance(self.graph, CSRGraph):
+            return self._search_csr(start, goal)
+
+        h = self._estimator(goal)
         open_set = []  # Priority queue for nodes to be evaluated
-        heapq.heappush(open_set, (0, start))  # Add the start node with priority 0
+        heapq.heappush(open_set, (h(start), start))  # Add the start node with its estimate
         came_from = {}  # Tracks the optimal path
-        g_score = {node: float('inf') for node in self.graph}  # Cost from start to node
-        g_score[start] = 0
-        f_score = {node: float('inf') for node in self.graph}  # Estimated total cost
-        f_score[start] = self.heuristic[start]
+        g_score = {start: 0}  # Cost from start to node
 
         while open_set:
             _, current = heapq.heappop(open_set)  # Get the node with the lowest f_score
@@ -36,12 +86,106 @@ class AStar:
             for neighbor, weight in self.graph[current]:
                 # Tentative g_score for the neighbor
                 tentative_g_score = g_score[current] + weight
-                if tentative_g_score < g_score[neighbor]:
+                if tentative_g_score < g_score.get(neighbor, float('inf')):
                     # Update path and scores
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self.heuristic[neighbor]
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    heapq.heappush(open_set, (tentative_g_score + h(neighbor), neighbor))
+
+        return None  # No path found
+
+    def _search_csr(self, start, goal):
+        """A* over the flat arrays of a CSRGraph, with lazily filled scores keyed by node id."""
+        graph = self.graph
+        h = self._estimator(goal, ids=True)
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        start, goal = graph.id_of(start), graph.id_of(goal)
+        g_score = {start: 0}
+        came_from = {}
+        open_set = [(h(start), 0, start)]
+
+        while open_set:
+            _, g, current = heapq.heappop(open_set)
+
+            if current == goal:
+                return [graph.label_of(node) for node in self._reconstruct_path(came_from, current)]
+            if g > g_score[current]:
+                continue  # Stale queue entry
+
+            for e in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[e]
+                tentative_g_score = g + weights[e]
+                if tentative_g_score < g_score.get(neighbor, float('inf')):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    heapq.heappush(open_set, (tentative_g_score + h(neighbor), tentative_g_score, neighbor))
+
+        return None  # No path found
+
+    def _search_queue(self, start, goal, open_set):
+        """A* driven by a decrease-key priority queue from the queues module."""
+        graph = self.graph
+        if isinstance(graph, CSRGraph):
+            h = self._estimator(goal, ids=True)
+            edges, label = _csr_edges(graph), graph.label_of
+            start, goal = graph.id_of(start), graph.id_of(goal)
+        else:
+            h = self._estimator(goal)
+            edges, label = graph.__getitem__, None
+        if h(start) == float('inf'):
+            return None  # No path found
+        g_score = {start: 0}
+        came_from = {}
+        open_set.push(start, h(start))
+
+        while open_set:
+            _, current = open_set.pop()
+
+            if current == goal:
+                path = self._reconstruct_path(came_from, current)
+                return [label(node) for node in path] if label is not None else path
+
+            for neighbor, weight in edges(current):
+                tentative_g_score = g_score[current] + weight
+                if tentative_g_score < g_score.get(neighbor, float('inf')):
+                    f_score = tentative_g_score + h(neighbor)
+                    if f_score == float('inf'):
+                        continue  # The heuristic proves the goal unreachable from here
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    open_set.push(neighbor, f_score)
+
+        return None  # No path found
+
+    def _search_context(self, start, goal, context):
+        """A* over a CSRGraph that keeps its scores in a reusable SearchContext."""
+        graph = self.graph
+        h = self._estimator(goal, ids=True)
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        g_score, came_from, stamp = context.distance, context.parent, context.stamp
+        generation = context.begin()
+        start, goal = graph.id_of(start), graph.id_of(goal)
+        g_score[start], came_from[start], stamp[start] = 0, -1, generation
+        open_set = [(h(start), 0, start)]
+
+        while open_set:
+            _, g, current = heapq.heappop(open_set)
+
+            if current == goal:
+                return [graph.label_of(node) for node in context.path_to(goal)]
+            if g > g_score[current]:
+                continue  # Stale queue entry
+
+            for e in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[e]
+                tentative_g_score = g + weights[e]
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                elif tentative_g_score >= g_score[neighbor]:
+                    continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                heapq.heappush(open_set, (tentative_g_score + h(neighbor), tentative_g_score, neighbor))
 
         return None  # No path found
 
@@ -60,6 +204,117 @@ class AStar:
         return path
 
 
+# ALT (A*, Landmarks, Triangle inequality) Heuristic
+class ALTHeuristic:
+    """
+    Landmark-based lower bounds for A*. For every landmark L, the triangle inequality
+    gives d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L); the heuristic
+    is the largest of these bounds over all landmarks. It is admissible and consistent
+    for any graph with non-negative weights.
+    Preprocessing: 2k Dijkstra runs (k = number of landmarks)
+    Space Complexity: O(kV) doubles
+    """
+    _HEADER = struct.Struct('=4s2q')  # magic, landmarks, nodes
+    _MAGIC = b'ALT1'
+
+    def __init__(self, graph, num_landmarks=8, landmarks=None, seed=0):
+        """
+        Picks landmarks and precomputes distances from and to each of them.
+        :param graph: Weighted adjacency list of the graph, or a CSRGraph.
+        :param num_landmarks: Number of landmarks to pick.
+        :param landmarks: Optional explicit list of landmark nodes.
+        :param seed: Random seed for the first landmark.
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph, weighted=True)
+        self.graph = graph
+        self.from_landmark, self.to_landmark = [], []
+        if graph.num_nodes == 0:
+            self.landmarks = []
+            return
+        reverse = graph.reverse()
+        if landmarks is not None:
+            self.landmarks = [graph.id_of(landmark) for landmark in landmarks]
+            for landmark in self.landmarks:
+                self._add_landmark(landmark, reverse)
+            return
+
+        # Farthest-point selection: each new landmark is the node farthest from the
+        # landmarks picked so far, which spreads them around the graph's periphery
+        self.landmarks = []
+        closest = [float('inf')] * graph.num_nodes
+        landmark = random.Random(seed).randrange(graph.num_nodes)
+        while len(self.landmarks) < min(num_landmarks, graph.num_nodes):
+            self.landmarks.append(landmark)
+            self._add_landmark(landmark, reverse)
+            distances = self.from_landmark[-1]
+            for node in range(graph.num_nodes):
+                if distances[node] < closest[node]:
+                    closest[node] = distances[node]
+            candidates = [node for node in range(graph.num_nodes) if node not in self.landmarks]
+            if not candidates:
+                break
+            # Prefer nodes no landmark reaches yet, then the farthest reachable node
+            landmark = max(candidates, key=lambda node: closest[node])
+
+    def _add_landmark(self, landmark, reverse):
+        self.from_landmark.append(array('d', _csr_distances(self.graph, landmark)))
+        self.to_landmark.append(array('d', _csr_distances(reverse, landmark)))
+
+    def bound(self, node, goal):
+        """Returns the landmark lower bound on d(node, goal) for CSR node ids."""
+        best = 0
+        for from_l, to_l in zip(self.from_landmark, self.to_landmark):
+            forward = from_l[goal] - from_l[node]
+            backward = to_l[node] - to_l[goal]
+            # NaN (inf - inf) compares False and is skipped
+            if forward > best:
+                best = forward
+            if backward > best:
+                best = backward
+        return best
+
+    def __call__(self, node, goal):
+        """Returns the lower bound on d(node, goal) for node keys."""
+        return self.bound(self.graph.id_of(node), self.graph.id_of(goal))
+
+    def save(self, path):
+        """
+        Writes a header, the landmark node ids, then the distance tables from and to each
+        landmark; the tables of a loaded heuristic are written from its mapping.
+        """
+        with atomic_write(path) as f:
+            f.write(self._HEADER.pack(self._MAGIC, len(self.landmarks), self.graph.num_nodes))
+            array('q', self.landmarks).tofile(f)
+            for table in self.from_landmark + self.to_landmark:
+                f.write(memoryview(table).cast('B'))  # Arrays, or views of a loaded file
+
+    @classmethod
+    def load(cls, path, graph):
+        """
+        Maps saved distance tables for graph without copying them.
+        :param path: Path written by save().
+        :param graph: The CSRGraph the tables were computed on.
+        :return: A new ALTHeuristic.
+        """
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, k, n = cls._HEADER.unpack_from(buffer)
+        if magic != cls._MAGIC or n != graph.num_nodes:
+            buffer.close()
+            raise ValueError(f"{path} does not hold ALT tables for this graph")
+        heuristic = cls.__new__(cls)
+        heuristic.graph = graph
+        view = memoryview(buffer)
+        offset = cls._HEADER.size
+        heuristic.landmarks = view[offset:offset + 8 * k].cast('q').tolist()
+        offset += 8 * k
+        tables = [view[offset + 8 * n * i:offset + 8 * n * (i + 1)].cast('d') for i in range(2 * k)]
+        heuristic.from_landmark, heuristic.to_landmark = tables[:k], tables[k:]
+        heuristic._mmap = buffer
+        return heuristic
+
+
 # Fibonacci Search
 def fibonacci_search(arr, target):
     """
@@ -84,11 +339,11 @@ def fibonacci_search(arr, target):
 
         if arr[i] < target:
             # Move the range one Fibonacci step ahead
-            fib, fib1, fib2 = fib1, fib2, fib - fib1
+            fib, fib1, fib2 = fib1, fib2, fib1 - fib2
             offset = i
         elif arr[i] > target:
             # Move the range one Fibonacci step back
-            fib, fib1, fib2 = fib2, fib - fib1, fib1 - fib2
+            fib, fib1, fib2 = fib2, fib1 - fib2, 2 * fib2 - fib1
         else:
             return i  # Target found
 
@@ -103,50 +358,17 @@ def fibonacci_search(arr, target):
 def kmp_search(text, pattern):
     """
     Performs the KMP pattern searching algorithm.
+    The compiled pattern (and its LPS table) is cached across calls; use
+    strings.compile_kmp or strings.AhoCorasick to find every match.
     :param text: The main string where the pattern is to be searched.
     :param pattern: The pattern to be searched.
     :return: Starting index of the pattern in the text, or -1 if not found.
     """
-    def compute_lps(pattern):
-        """
-        Computes the Longest Prefix Suffix (LPS) array.
-        :param pattern: The pattern for which LPS is computed.
-        :return: LPS array.
-        """
-        lps = [0] * len(pattern)
-        length = 0  # Length of the previous longest prefix suffix
-        i = 1
-
-        while i < len(pattern):
-            if pattern[i] == pattern[length]:
-                length += 1
-                lps[i] = length
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length - 1]
-                else:
-                    lps[i] = 0
-                    i += 1
-        return lps
-
-    lps = compute_lps(pattern)
-    i = j = 0  # Pointers for text and pattern
-
-    while i < len(text):
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-
-        if j == len(pattern):  # Full pattern matched
-            return i - j
-        elif i < len(text) and pattern[j] != text[i]:
-            if j != 0:
-                j = lps[j - 1]
-            else:
-                i += 1
-
-    return -1  # No match found
+    try:
+        compiled = compile_kmp(pattern)
+    except TypeError:  # Unhashable patterns such as lists are compiled per call
+        compiled = KMPPattern(pattern)
+    return compiled.search(text)
 
 
 # Binary Search in 2D Matrix
@@ -193,6 +415,8 @@ if __name__ == "__main__":
     heuristic = {'A': 6, 'B': 4, 'C': 5, 'D': 2, 'E': 2, 'F': 3, 'G': 0}
     astar = AStar(graph, heuristic)
     print("Path from A to G:", astar.search('A', 'G'))  # Output: ['A', 'B', 'E', 'G']
+    alt = ALTHeuristic(graph, num_landmarks=2)
+    print("Path from A to G (ALT):", AStar(alt.graph, alt).search('A', 'G'))  # Output: ['A', 'B', 'D', 'G']
 
     # Fibonacci Search Test
     print("\nFibonacci Search:")
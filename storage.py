@@ -0,0 +1,49 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+# Atomic File Writes
+def _umask():
+    """Returns the process umask (reading it requires setting it, so restore it at once)."""
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+@contextmanager
+def atomic_write(path):
+    """
+    Opens a temporary file beside path for binary writing and renames it over path once
+    the block completes. Readers never see a partial file, and an object still
+    memory-mapped from path keeps its old pages, so a loaded structure can be saved back
+    in place. The file gets the permissions open(path, 'wb') would give a new file; on
+    error the temporary file is removed and path is left untouched.
+    :param path: Destination file path.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(temp_path, 0o666 & ~_umask())  # mkstemp creates files as 0600
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+# Test Cases
+if __name__ == "__main__":
+    import mmap
+    import stat
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'data.bin')
+        with atomic_write(path) as f:
+            f.write(b'first')
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with atomic_write(path) as out:
+                out.write(mm[:] + b' and second')  # Reads the mapping while replacing its file
+        with open(path, 'rb') as f:
+            print("Contents:", f.read())  # Output: b'first and second'
+        print("Mode:", oct(stat.S_IMODE(os.stat(path).st_mode)))  # Output: 0o644 (with umask 022)
@@ -0,0 +1,597 @@
+import mmap
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; suffix arrays fall back to list sorting
+    np = None
+
+from search import binary_search
+from storage import atomic_write
+
+
+# Compiled KMP Pattern
+def compute_lps(pattern):
+    """
+    Computes the Longest Prefix Suffix (LPS) array, KMP's failure table.
+    :param pattern: The pattern for which LPS is computed.
+    :return: LPS list; lps[i] is the length of the longest proper prefix of
+             pattern[:i + 1] that is also its suffix.
+    """
+    lps = [0] * len(pattern)
+    length = 0  # Length of the previous longest prefix suffix
+    i = 1
+
+    while i < len(pattern):
+        if pattern[i] == pattern[length]:
+            length += 1
+            lps[i] = length
+            i += 1
+        elif length != 0:
+            length = lps[length - 1]
+        else:
+            i += 1
+    return lps
+
+
+class KMPPattern:
+    """
+    A pattern compiled once for Knuth-Morris-Pratt matching. The failure table is
+    built in the constructor and reused by every search, so scanning many texts for
+    the same pattern costs O(n) per text instead of O(n + m).
+    Works on str, bytes, bytearray and mmap texts (with a pattern of the same kind)
+    as well as on lists or tuples of symbols.
+    """
+    def __init__(self, pattern):
+        """:param pattern: The pattern to be searched."""
+        self.pattern = pattern
+        self.lps = compute_lps(pattern)
+
+    def search(self, text, start=0):
+        """
+        :param text: The text to scan.
+        :param start: Index to start scanning from.
+        :return: Starting index of the first match, or -1 if not found.
+        """
+        return next(self.finditer(text, start), -1)
+
+    def finditer(self, text, start=0, overlapping=True):
+        """
+        Lazily yields the starting index of every match in text.
+        :param text: The text to scan.
+        :param start: Index to start scanning from.
+        :param overlapping: Report overlapping matches ("aa" occurs 3 times in "aaaa");
+                            otherwise scanning resumes after each match.
+        """
+        pattern, lps, m, n = self.pattern, self.lps, len(self.pattern), len(text)
+        if m == 0:
+            yield from range(start, n + 1)
+            return
+        # Strings, bytes and mmaps can skip to the next candidate start in C
+        find = getattr(text, 'find', None)
+        first = pattern[:1]
+        i, j = start, 0
+
+        while i < n:
+            if j == 0 and find is not None:
+                i = find(first, i)
+                if i == -1:
+                    return
+            symbol = text[i]
+            while j and pattern[j] != symbol:
+                j = lps[j - 1]
+            if pattern[j] == symbol:
+                j += 1
+                if j == m:  # Full pattern matched
+                    yield i - m + 1
+                    j = lps[j - 1] if overlapping else 0
+            i += 1
+
+    def count(self, text, overlapping=True):
+        """:return: Number of matches of the pattern in text."""
+        return sum(1 for _ in self.finditer(text, overlapping=overlapping))
+
+
+@lru_cache(maxsize=256)
+def compile_kmp(pattern):
+    """
+    Returns a cached KMPPattern for pattern, so repeated calls with the same
+    pattern reuse its failure table.
+    :param pattern: A hashable pattern (str, bytes or tuple).
+    """
+    return KMPPattern(pattern)
+
+
+# Streaming KMP Search
+class KMPStream:
+    """
+    KMP matcher that consumes text in chunks and keeps its state (the length of the
+    pattern prefix matched so far) across calls, so matches straddling chunk
+    boundaries are found and every offset is absolute within the whole stream.
+    While no partial match is pending it jumps ahead with the chunk's C-level find;
+    symbols are stepped in Python only to carry a partial match over a boundary.
+    """
+    def __init__(self, pattern, overlapping=True):
+        """
+        :param pattern: The pattern (str, bytes or KMPPattern) to be searched.
+        :param overlapping: Report overlapping matches.
+        """
+        self.compiled = pattern if isinstance(pattern, KMPPattern) else KMPPattern(pattern)
+        if not self.compiled.pattern:
+            raise ValueError("KMPStream needs a non-empty pattern")
+        self.overlapping = overlapping
+        self.offset = 0  # Symbols consumed so far
+        self._state = 0
+        self._regex = None  # Compiled on the first memoryview chunk
+
+    def _finder(self, data):
+        """Returns a find(sub, start, end) for data, or None to step symbol by symbol."""
+        find = getattr(data, 'find', None)
+        if find is None and isinstance(data, memoryview):
+            # memoryviews lack find(), but re scans any buffer in place
+            if self._regex is None:
+                self._regex = re.compile(re.escape(bytes(self.compiled.pattern)))
+            search = self._regex.search
+
+            def find(sub, start, end):
+                match = search(data, start, end)
+                return match.start() if match else -1
+        return find
+
+    def feed(self, data, start=0, end=None):
+        """
+        Consumes data[start:end] without copying it.
+        :param data: The next chunk (str, bytes, bytearray, mmap or memoryview).
+        :param start: Index of the first symbol to consume.
+        :param end: Index after the last symbol to consume; defaults to len(data).
+        :return: List of absolute starting offsets of the matches that end in this chunk.
+        """
+        if end is None:
+            end = len(data)
+        pattern, lps = self.compiled.pattern, self.compiled.lps
+        m = len(pattern)
+        step = 1 if self.overlapping else m
+        find = self._finder(data)
+        base = self.offset - start  # Absolute offset of data[0]
+        matches = []
+        i, j = start, self._state
+
+        while i < end:
+            if j == 0 and find is not None:
+                k = find(pattern, i, end)
+                if k != -1:
+                    matches.append(base + k)
+                    i = k + step
+                    continue
+                # Only a partial match can straddle the boundary; step through the tail
+                i = max(i, end - m + 1)
+                find = None
+                continue
+            symbol = data[i]
+            while j and pattern[j] != symbol:
+                j = lps[j - 1]
+            if pattern[j] == symbol:
+                j += 1
+                if j == m:  # Full pattern matched
+                    matches.append(base + i - m + 1)
+                    j = lps[j - 1] if self.overlapping else 0
+            i += 1
+
+        self._state = j
+        self.offset += end - start
+        return matches
+
+
+def search_stream(source, pattern, chunk_size=1 << 20, overlapping=True):
+    """
+    Lazily yields the absolute starting offset of every match of pattern in a stream.
+    :param source: An mmap, bytes, bytearray, str or memoryview (scanned by index from
+                   offset 0, without moving an mmap's file position), a binary file
+                   object (read with readinto into one reused buffer), a text file
+                   object, or an iterable of str/bytes chunks.
+    :param pattern: The pattern to be searched (bytes for binary sources).
+    :param chunk_size: Bytes read or scanned per step.
+    :param overlapping: Report overlapping matches.
+    """
+    matcher = KMPStream(pattern, overlapping)
+    # Buffers first: an mmap also has read(), which would copy it and move its position
+    if isinstance(source, (mmap.mmap, bytes, bytearray, str)):
+        for start in range(0, len(source), chunk_size):
+            yield from matcher.feed(source, start, min(start + chunk_size, len(source)))
+    elif isinstance(source, memoryview):
+        view = source.cast('B') if source.format != 'B' or source.ndim != 1 else source
+        for start in range(0, len(view), chunk_size):
+            yield from matcher.feed(view, start, min(start + chunk_size, len(view)))
+    elif hasattr(source, 'readinto'):
+        buffer = bytearray(chunk_size)
+        while True:
+            size = source.readinto(buffer)
+            if not size:
+                return
+            yield from matcher.feed(buffer, 0, size)
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield from matcher.feed(chunk)
+    else:
+        for chunk in source:
+            yield from matcher.feed(chunk)
+
+
+def search_file(path, pattern, overlapping=True):
+    """
+    Memory-maps a file and lazily yields the byte offset of every match of pattern.
+    The operating system pages the file in, so files larger than memory work.
+    :param path: Path of the file to scan.
+    :param pattern: Bytes pattern to be searched.
+    :param overlapping: Report overlapping matches.
+    """
+    if os.path.getsize(path) == 0:  # mmap cannot map empty files
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        yield from search_stream(mm, pattern, overlapping=overlapping)
+
+
+# Suffix Array Index
+def _suffix_array(text):
+    """
+    Builds the suffix array of text by prefix doubling: after round k the suffixes
+    are sorted by their first 2^k symbols, and sorting stops once all ranks differ.
+    Time Complexity: O(n log^2 n) (O(n log n) sorts, at most log n rounds)
+    """
+    n = len(text)
+    codes = [ord(symbol) for symbol in text] if isinstance(text, str) else list(text)
+    if np is not None and n:
+        return _numpy_suffix_array(np.asarray(codes, dtype=np.int64))
+    dense = {code: rank for rank, code in enumerate(sorted(set(codes)))}
+    rank = [dense[code] for code in codes]
+    order = sorted(range(n), key=rank.__getitem__)
+    k = 1
+    while k < n:
+        # Key of suffix i: its rank, then the rank of suffix i + k (0 past the end)
+        shifted = [r + 1 for r in rank[k:]] + [0] * k
+        keys = [r * (n + 1) + s for r, s in zip(rank, shifted)]
+        order.sort(key=keys.__getitem__)
+        new_rank, r, previous = [0] * n, 0, keys[order[0]]
+        for i in order:
+            if keys[i] != previous:
+                r += 1
+                previous = keys[i]
+            new_rank[i] = r
+        rank = new_rank
+        if r == n - 1:
+            break
+        k *= 2
+    return order
+
+
+def _numpy_suffix_array(codes):
+    """Prefix doubling with NumPy argsort; codes is an int64 array of symbol codes."""
+    n = len(codes)
+    rank = np.unique(codes, return_inverse=True)[1].astype(np.int64)
+    k = 1
+    while True:
+        shifted = np.zeros(n, dtype=np.int64)
+        if k < n:
+            shifted[:n - k] = rank[k:] + 1
+        keys = rank * (n + 1) + shifted
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.concatenate(([0], np.cumsum(sorted_keys[1:] != sorted_keys[:-1])))
+        if rank.max() == n - 1 or k >= n:
+            return order.tolist()
+        k *= 2
+
+
+def _lcp_array(text, suffixes):
+    """
+    Kasai's algorithm: lcp[i] is the length of the longest common prefix of the
+    suffixes at suffixes[i - 1] and suffixes[i] (lcp[0] = 0).
+    Time Complexity: O(n)
+    """
+    n = len(text)
+    rank = [0] * n
+    for i, start in enumerate(suffixes):
+        rank[start] = i
+    lcp = [0] * n
+    h = 0
+    for start in range(n):
+        if rank[start] > 0:
+            previous = suffixes[rank[start] - 1]
+            while start + h < n and previous + h < n and text[start + h] == text[previous + h]:
+                h += 1
+            lcp[rank[start]] = h
+            if h:
+                h -= 1
+        else:
+            h = 0
+    return lcp
+
+
+class _SuffixPrefixes:
+    """
+    Read-only sequence of the length-m prefixes of the sorted suffixes, so the
+    binary-search routines can search the suffix array for a pattern directly.
+    """
+    def __init__(self, text, suffixes, m, base=0):
+        self.text, self.suffixes, self.m, self.base = text, suffixes, m, base
+
+    def __len__(self):
+        return len(self.suffixes)
+
+    def __getitem__(self, i):
+        start = self.base + self.suffixes[i]
+        return self.text[start:start + self.m]
+
+
+class SuffixArrayIndex:
+    """
+    Substring index over a static text: the suffix array lists the suffixes in
+    sorted order, so all occurrences of a pattern form one contiguous range found
+    by binary search. The LCP array stores the common prefix length of neighboring
+    suffixes. Both are compact integer arrays and can be saved and memory-mapped.
+    Time Complexity: O(m log n) per occurs/count query, plus O(occ) for positions
+    Space Complexity: O(n) (4 or 8 bytes per symbol for each array)
+    """
+    _HEADER = struct.Struct('=4sc?2xq')  # magic, typecode, text is str, length
+    _MAGIC = b'SAX1'
+
+    def __init__(self, text):
+        """:param text: The corpus to index (str or bytes)."""
+        self.text = text
+        self.typecode = 'i' if len(text) < 2 ** 31 else 'q'
+        self.suffixes = array(self.typecode, _suffix_array(text))
+        self.lcp = array(self.typecode, _lcp_array(text, self.suffixes))
+        self._base = 0  # Offset of the text inside self.text (non-zero when mapped)
+        self._mmap = None
+
+    def __len__(self):
+        return len(self.suffixes)
+
+    def _range(self, pattern):
+        """Returns the half-open range of suffix-array slots starting with pattern."""
+        prefixes = _SuffixPrefixes(self.text, self.suffixes, len(pattern), self._base)
+        low = bisect_left(prefixes, pattern)
+        return low, bisect_right(prefixes, pattern, low)
+
+    def occurs(self, pattern):
+        """:return: True if pattern occurs in the text."""
+        prefixes = _SuffixPrefixes(self.text, self.suffixes, len(pattern), self._base)
+        return binary_search(prefixes, pattern) != -1
+
+    def count(self, pattern):
+        """:return: Number of (possibly overlapping) occurrences of pattern."""
+        low, high = self._range(pattern)
+        return high - low
+
+    def positions(self, pattern):
+        """
+        :return: Sorted list of the starting indices of every occurrence of pattern.
+        """
+        prefixes = _SuffixPrefixes(self.text, self.suffixes, len(pattern), self._base)
+        low = bisect_left(prefixes, pattern)
+        if low == len(prefixes) or prefixes[low] != pattern:
+            return []
+        # Neighbors share the pattern as long as their common prefix is long enough
+        high = low + 1
+        while high < len(self.lcp) and self.lcp[high] >= len(pattern):
+            high += 1
+        return sorted(self.suffixes[low:high])
+
+    def longest_repeated_substring(self):
+        """:return: The longest substring occurring at least twice (empty if none)."""
+        if len(self.lcp) < 2:
+            return self.text[self._base:self._base]
+        i = max(range(len(self.lcp)), key=self.lcp.__getitem__)
+        start = self._base + self.suffixes[i]
+        return self.text[start:start + self.lcp[i]]
+
+    def save(self, path):
+        """Writes the index as a header, the suffix and LCP arrays, then the text."""
+        is_str = isinstance(self.text, str)
+        with atomic_write(path) as f:
+            f.write(self._HEADER.pack(self._MAGIC, self.typecode.encode(), is_str, len(self)))
+            f.write(memoryview(self.suffixes).cast('B'))
+            f.write(memoryview(self.lcp).cast('B'))
+            if is_str:
+                f.write(self.text.encode('utf-32-le'))  # Fixed width keeps indices valid
+            else:
+                f.write(self.text[self._base:])
+
+    @classmethod
+    def load(cls, path):
+        """
+        Maps a saved index without reading the arrays. Bytes corpora are searched in
+        place in the mapping; str corpora are decoded into memory.
+        :param path: Path written by save().
+        :return: A new SuffixArrayIndex.
+        """
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, typecode, is_str, n = cls._HEADER.unpack_from(buffer)
+        if magic != cls._MAGIC:
+            buffer.close()
+            raise ValueError(f"{path} is not a saved SuffixArrayIndex")
+        index = cls.__new__(cls)
+        index.typecode = typecode.decode()
+        width = array(index.typecode).itemsize
+        view = memoryview(buffer)
+        offset = cls._HEADER.size
+        index.suffixes = view[offset:offset + width * n].cast(index.typecode)
+        index.lcp = view[offset + width * n:offset + 2 * width * n].cast(index.typecode)
+        view.release()
+        offset += 2 * width * n
+        if is_str:
+            index.text, index._base = buffer[offset:].decode('utf-32-le'), 0
+        else:
+            index.text, index._base = buffer, offset
+        index._mmap = buffer
+        return index
+
+    def close(self):
+        """Releases the memory map of a loaded index; it must not be used afterwards."""
+        if self._mmap is not None:
+            self.suffixes.release()
+            self.lcp.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Aho-Corasick Multi-Pattern Search
+class AhoCorasick:
+    """
+    Finds every occurrence of many patterns in a single pass over the text.
+    The trie is compiled into a full DFA: transitions live in one flat array
+    indexed by state * alphabet_size + symbol, so each text symbol costs one
+    array lookup no matter how many patterns there are. The alphabet is only the
+    symbols that occur in the patterns; any other symbol resets to the root.
+    Time Complexity: O(n + matches) per scan, O(P * alphabet_size) to build
+    (P = total pattern length)
+    Space Complexity: O(P * alphabet_size) 32-bit transitions
+    """
+    def __init__(self, patterns):
+        """
+        :param patterns: Iterable of non-empty patterns, all str or all bytes.
+        """
+        self.patterns = list(patterns)
+        alphabet = {}
+        for pattern in self.patterns:
+            if not pattern:
+                raise ValueError("AhoCorasick patterns must be non-empty")
+            for symbol in pattern:
+                alphabet.setdefault(symbol, len(alphabet))
+        sigma = max(len(alphabet), 1)
+
+        # Build the trie; terminal[state] heads the chain of patterns ending there
+        children = [{}]
+        terminal = [-1]
+        next_pattern = array('i', [-1]) * len(self.patterns)  # Chains duplicate patterns
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for symbol in pattern:
+                code = alphabet[symbol]
+                child = children[state].get(code)
+                if child is None:
+                    child = len(children)
+                    children[state][code] = child
+                    children.append({})
+                    terminal.append(-1)
+                state = child
+            next_pattern[index] = terminal[state]
+            terminal[state] = index
+
+        # Breadth-first pass: fill in missing transitions from the failure state and
+        # link each state to the nearest suffix state where a pattern ends
+        num_states = len(children)
+        delta = array('i', [0]) * (num_states * sigma)
+        output_link = array('i', [-1]) * num_states
+        fail = array('i', [0]) * num_states
+        queue = deque()
+        for code, child in children[0].items():
+            delta[code] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            failure = fail[state]
+            output_link[state] = failure if terminal[failure] != -1 else output_link[failure]
+            base, failure_base = state * sigma, failure * sigma
+            delta[base:base + sigma] = delta[failure_base:failure_base + sigma]
+            for code, child in children[state].items():
+                fail[child] = delta[failure_base + code]
+                delta[base + code] = child
+                queue.append(child)
+
+        self._alphabet = alphabet
+        self._sigma = sigma
+        self._delta = delta
+        self._terminal = array('i', terminal)
+        self._next_pattern = next_pattern
+        self._output_link = output_link
+        self._lengths = array('i', (len(pattern) for pattern in self.patterns))
+
+    @property
+    def num_states(self):
+        return len(self._terminal)
+
+    def finditer(self, text):
+        """
+        Lazily yields (start, pattern_index) for every occurrence of every pattern,
+        ordered by the position where the match ends.
+        :param text: The text to scan (same kind as the patterns).
+        """
+        alphabet, sigma, delta = self._alphabet, self._sigma, self._delta
+        terminal, next_pattern = self._terminal, self._next_pattern
+        output_link, lengths = self._output_link, self._lengths
+        state = 0
+
+        for i, symbol in enumerate(text):
+            code = alphabet.get(symbol)
+            if code is None:
+                state = 0
+                continue
+            state = delta[state * sigma + code]
+            match = state if terminal[state] != -1 else output_link[state]
+            while match != -1:
+                index = terminal[match]
+                while index != -1:
+                    yield i - lengths[index] + 1, index
+                    index = next_pattern[index]
+                match = output_link[match]
+
+    def counts(self, text):
+        """:return: List with the number of occurrences of each pattern in text."""
+        counts = [0] * len(self.patterns)
+        for _, index in self.finditer(text):
+            counts[index] += 1
+        return counts
+
+
+if __name__ == "__main__":
+    # Compiled KMP Pattern Test
+    print("Compiled KMP Pattern:")
+    pattern = compile_kmp("aba")
+    print("All matches:", list(pattern.finditer("abababa")))  # Output: [0, 2, 4]
+    print("Non-overlapping:", list(pattern.finditer("abababa", overlapping=False)))  # Output: [0, 4]
+    print("Count in bytes:", KMPPattern(b"GET").count(b"GET /a\nPOST /b\nGET /c"))  # Output: 2
+
+    # Streaming KMP Test
+    print("\nStreaming KMP:")
+    chunks = [b"xxab", b"cabc", b"yab", b"c"]  # Matches straddle the chunk boundaries
+    print("Offsets:", list(search_stream(chunks, b"abc")))  # Output: [2, 5, 9]
+    data = b"abcababcab"
+    print("Memoryview:", list(search_stream(memoryview(data), b"abc", chunk_size=4)))  # Output: [0, 5]
+    with mmap.mmap(-1, len(data)) as mm:
+        mm.write(data)  # Leaves the file position at the end
+        print("Mmap twice:", list(search_stream(mm, b"abc")), list(search_stream(mm, b"abc")))  # Output: [0, 5] [0, 5]
+
+    # Suffix Array Index Test
+    print("\nSuffix Array Index:")
+    index = SuffixArrayIndex("banana")
+    print("Suffix array:", list(index.suffixes))  # Output: [5, 3, 1, 0, 4, 2]
+    print("'ana' occurs:", index.occurs("ana"), "count:", index.count("ana"))  # Output: True count: 2
+    print("'an' positions:", index.positions("an"))  # Output: [1, 3]
+    print("Longest repeat:", index.longest_repeated_substring())  # Output: ana
+
+    # Aho-Corasick Test
+    print("\nAho-Corasick:")
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    print("Matches:", [(start, automaton.patterns[index])
+                       for start, index in automaton.finditer("ushers")])  # Output: [(1, 'she'), (2, 'he'), (2, 'hers')]
+    print("Counts:", automaton.counts("he said she saw his hershey"))  # Output: [4, 2, 1, 1]
@@ -1,83 +1,550 @@
+import mmap
+import os
+import struct
+import tempfile
+from array import array
 from collections import deque
 
+from csr import CSRGraph
+from implicit import ImplicitGraph, state_successors
+from storage import atomic_write
+
 # Binary Search Tree (BST) Implementation
 class BSTNode:
+    __slots__ = ('key', 'left', 'right', 'height')
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
+        self.height = 1  # Only maintained by balanced trees
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _update_height(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Restores the AVL invariant at node and returns the new subtree root."""
+    _update_height(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
 
 class BinarySearchTree:
-    def __init__(self):
+    def __init__(self, balanced=False):
+        """
+        Creates an empty BST.
+        :param balanced: Keep the tree height-balanced (AVL) on insert and delete.
+        """
         self.root = None
+        self.balanced = balanced
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, keys, balanced=True):
+        """
+        Builds a perfectly balanced tree from strictly increasing keys in O(n).
+        :param keys: Sorted sequence of unique keys.
+        :param balanced: Whether later inserts and deletes keep the tree balanced.
+        :return: A new BinarySearchTree.
+        """
+        def build(lo, hi):  # Recursion depth is only O(log n)
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = BSTNode(keys[mid])
+            node.left = build(lo, mid - 1)
+            node.right = build(mid + 1, hi)
+            _update_height(node)
+            return node
+
+        tree = cls(balanced)
+        tree.root = build(0, len(keys) - 1)
+        tree.size = len(keys)
+        return tree
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.search(key) is not None
+
+    def __iter__(self):
+        """Yields the keys in sorted order."""
+        return self.range()
+
+    def _retrace(self, path):
+        """Rebalances the nodes on path bottom-up, relinking each new subtree root."""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            subtree = _rebalance(node)
+            if subtree is not node:
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1].left is node:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
 
     def insert(self, key):
         """Inserts a new key into the BST."""
         if self.root is None:
             self.root = BSTNode(key)
+            self.size = 1
+            return
+        path = []
+        node = self.root
+        while True:
+            path.append(node)
+            if key < node.key:
+                if node.left is None:
+                    node.left = BSTNode(key)
+                    break
+                node = node.left
+            elif key > node.key:
+                if node.right is None:
+                    node.right = BSTNode(key)
+                    break
+                node = node.right
+            else:
+                return  # Duplicate keys are ignored
+        self.size += 1
+        if self.balanced:
+            self._retrace(path)
+
+    def search(self, key):
+        """Searches for a key in the BST."""
+        node = self.root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def delete(self, key):
+        """
+        Removes a key from the BST.
+        :param key: Key to remove.
+        :return: True if the key was removed, False if it was not present.
+        """
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            # Replace the key with its in-order successor and remove that node instead
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
         else:
-            self._insert_recursive(self.root, key)
+            path[-1].right = child
+        self.size -= 1
+        if self.balanced:
+            self._retrace(path)
+        return True
 
-    def _insert_recursive(self, node, key):
-        if key < node.key:
-            if node.left is None:
-                node.left = BSTNode(key)
+    def floor(self, key):
+        """Returns the largest key <= key, or None if there is none."""
+        node, result = self.root, None
+        while node is not None:
+            if node.key == key:
+                return key
+            if node.key < key:
+                result = node.key
+                node = node.right
             else:
-                self._insert_recursive(node.left, key)
-        elif key > node.key:
-            if node.right is None:
-                node.right = BSTNode(key)
+                node = node.left
+        return result
+
+    def ceiling(self, key):
+        """Returns the smallest key >= key, or None if there is none."""
+        node, result = self.root, None
+        while node is not None:
+            if node.key == key:
+                return key
+            if node.key > key:
+                result = node.key
+                node = node.left
             else:
-                self._insert_recursive(node.right, key)
+                node = node.right
+        return result
+
+    def range(self, low=None, high=None):
+        """
+        Yields the keys in [low, high] in sorted order, iteratively.
+        :param low: Inclusive lower bound, or None for no bound.
+        :param high: Inclusive upper bound, or None for no bound.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            # Walk left, skipping subtrees that lie entirely below low
+            while node is not None:
+                if low is not None and node.key < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if high is not None and node.key > high:
+                return
+            yield node.key
+            node = node.right
+
+
+# Array-Backed Binary Search Tree
+class ArrayBinarySearchTree:
+    """
+    Stores the BST as parallel typed arrays: keys[i], left[i] and right[i] describe
+    slot i, and -1 marks a missing child. A node costs itemsize + 8 bytes (16 bytes
+    for int64 keys) instead of a full Python object. Deleted slots are chained into a
+    free-list through left[] and reused by later inserts.
+    """
+    _HEADER = struct.Struct('=4sc3x4q')  # magic, typecode, slots, size, root, free head
+    _MAGIC = b'ABST'
+
+    def __init__(self, typecode='q'):
+        self.typecode = typecode
+        self.keys = array(typecode)
+        self.left = array('i')
+        self.right = array('i')
+        self.root = -1
+        self.free = -1  # Head of the free-list of deleted slots
+        self.size = 0
+        self._mmap = None
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self._find(key)[0] != -1
+
+    def _materialize(self):
+        """Copies memory-mapped storage into growable arrays before the first append."""
+        if isinstance(self.keys, memoryview):
+            keys, left, right = array(self.typecode), array('i'), array('i')
+            keys.frombytes(self.keys.cast('B'))
+            left.frombytes(self.left.cast('B'))
+            right.frombytes(self.right.cast('B'))
+            self._release()
+            self.keys, self.left, self.right = keys, left, right
+
+    def _allocate(self, key):
+        slot = self.free
+        if slot != -1:
+            self.free = self.left[slot]
+            self.keys[slot] = key
+            self.left[slot] = self.right[slot] = -1
+            return slot
+        self._materialize()
+        self.keys.append(key)
+        self.left.append(-1)
+        self.right.append(-1)
+        return len(self.keys) - 1
+
+    def _find(self, key):
+        """Returns (slot, parent slot) of key, with slot -1 if the key is missing."""
+        keys, left, right = self.keys, self.left, self.right
+        parent, slot = -1, self.root
+        while slot != -1:
+            current = keys[slot]
+            if key == current:
+                break
+            parent = slot
+            slot = left[slot] if key < current else right[slot]
+        return slot, parent
+
+    def insert(self, key):
+        """Inserts a new key into the BST."""
+        if self.root == -1:
+            self.root = self._allocate(key)
+            self.size = 1
+            return
+        keys, slot = self.keys, self.root
+        while True:
+            current = keys[slot]
+            if key < current:
+                child = self.left[slot]
+                if child == -1:
+                    self.left[slot] = self._allocate(key)
+                    break
+            elif key > current:
+                child = self.right[slot]
+                if child == -1:
+                    self.right[slot] = self._allocate(key)
+                    break
+            else:
+                return  # Duplicate keys are ignored
+            slot = child
+        self.size += 1
 
     def search(self, key):
-        """Searches for a key in the BST."""
-        return self._search_recursive(self.root, key)
+        """Searches for a key in the BST. Returns True if it is present."""
+        return self._find(key)[0] != -1
 
-    def _search_recursive(self, node, key):
-        if node is None or node.key == key:
-            return node
-        if key < node.key:
-            return self._search_recursive(node.left, key)
-        return self._search_recursive(node.right, key)
+    def delete(self, key):
+        """
+        Removes a key from the BST and returns its slot to the free-list.
+        :param key: Key to remove.
+        :return: True if the key was removed, False if it was not present.
+        """
+        slot, parent = self._find(key)
+        if slot == -1:
+            return False
+        left, right = self.left, self.right
+        if left[slot] != -1 and right[slot] != -1:
+            # Move the in-order successor's key here and unlink the successor instead
+            parent, successor = slot, right[slot]
+            while left[successor] != -1:
+                parent, successor = successor, left[successor]
+            self.keys[slot] = self.keys[successor]
+            slot = successor
+
+        child = left[slot] if left[slot] != -1 else right[slot]
+        if parent == -1:
+            self.root = child
+        elif left[parent] == slot:
+            left[parent] = child
+        else:
+            right[parent] = child
+        left[slot], right[slot] = self.free, -1
+        self.free = slot
+        self.size -= 1
+        return True
+
+    def __iter__(self):
+        """Yields the keys in sorted order, iteratively."""
+        stack, slot = [], self.root
+        while stack or slot != -1:
+            while slot != -1:
+                stack.append(slot)
+                slot = self.left[slot]
+            slot = stack.pop()
+            yield self.keys[slot]
+            slot = self.right[slot]
+
+    def save(self, path):
+        """
+        Writes a header (typecode, slot count, size, root, free-list head) followed by
+        the key, left-child and right-child arrays, free slots included, so load() can
+        map them as they are.
+        """
+        with atomic_write(path) as f:
+            f.write(self._HEADER.pack(self._MAGIC, self.typecode.encode(), len(self.keys),
+                                      self.size, self.root, self.free))
+            for buffer in (self.keys, self.left, self.right):
+                f.write(memoryview(buffer).cast('B'))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Maps a saved tree without reading it: startup cost is independent of its size.
+        Pages are loaded on demand, and writes stay private to this process.
+        :param path: Path written by save().
+        :return: A new ArrayBinarySearchTree.
+        """
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, typecode, slots, size, root, free = cls._HEADER.unpack_from(buffer)
+        if magic != cls._MAGIC:
+            buffer.close()
+            raise ValueError(f"{path} is not a saved ArrayBinarySearchTree")
+        tree = cls(typecode.decode())
+        view = memoryview(buffer)
+        key_bytes = slots * tree.keys.itemsize
+        offset = cls._HEADER.size
+        tree.keys = view[offset:offset + key_bytes].cast(tree.typecode)
+        offset += key_bytes
+        child_bytes = slots * tree.left.itemsize
+        tree.left = view[offset:offset + child_bytes].cast('i')
+        tree.right = view[offset + child_bytes:offset + 2 * child_bytes].cast('i')
+        view.release()
+        tree.size, tree.root, tree.free = size, root, free
+        tree._mmap = buffer
+        return tree
+
+    def _release(self):
+        if self._mmap is not None:
+            for view in (self.keys, self.left, self.right):
+                view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self):
+        """Releases the memory map of a loaded tree; the tree must not be used afterwards."""
+        self._release()
 
 
 # Graph Implementation for DFS and BFS
 class Graph:
     def __init__(self):
         self.adjacency_list = {}
+        self.version = 0  # Bumped on every mutation so caches can detect changes
+
+    @classmethod
+    def from_successors(cls, neighbors):
+        """
+        Creates a graph whose nodes are generated lazily by a successor function.
+        :param neighbors: Function neighbors(state) -> iterable of (state, cost) pairs.
+        :return: A Graph that can be traversed but not extended with add_edge.
+        """
+        graph = cls()
+        graph.adjacency_list = ImplicitGraph(neighbors)
+        return graph
 
     def add_edge(self, u, v):
         """Adds a directed edge from node u to node v."""
         if u not in self.adjacency_list:
             self.adjacency_list[u] = []
         self.adjacency_list[u].append(v)
+        self.version += 1
 
-    def dfs(self, start, visited=None):
-        """Performs Depth-First Search (DFS) from a starting node."""
+    def to_csr(self):
+        """Returns the graph as a CSRGraph with the same node keys."""
+        return CSRGraph.from_dict(self.adjacency_list, weighted=False)
+
+    def iter_dfs(self, start, max_depth=None, visitor=None, with_info=False, visited=None):
+        """
+        Lazily yields nodes in Depth-First Search (DFS) preorder, iteratively.
+        :param start: Starting node.
+        :param max_depth: Do not expand nodes at this depth, or None for no limit.
+        :param visitor: Optional callback visitor(node, depth, parent); returning a
+                        truthy value stops the traversal after that node.
+        :param with_info: Yield (node, depth, parent) tuples instead of bare nodes.
+        :param visited: Optional set of nodes to treat as already visited.
+        """
         if visited is None:
             visited = set()
         visited.add(start)
-        print(start, end=" ")
+        successors = state_successors(self.adjacency_list)
+        stack = [(start, 0, iter(successors(start)))]
+        yield (start, 0, None) if with_info else start
+        if visitor is not None and visitor(start, 0, None):
+            return
 
-        for neighbor in self.adjacency_list.get(start, []):
-            if neighbor not in visited:
-                self.dfs(neighbor, visited)
+        while stack:
+            node, depth, neighbors = stack[-1]
+            if max_depth is not None and depth >= max_depth:
+                stack.pop()
+                continue
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield (neighbor, depth + 1, node) if with_info else neighbor
+                    if visitor is not None and visitor(neighbor, depth + 1, node):
+                        return
+                    stack.append((neighbor, depth + 1, iter(successors(neighbor))))
+                    break
+            else:
+                stack.pop()
 
-    def bfs(self, start):
-        """Performs Breadth-First Search (BFS) from a starting node."""
-        visited = set()
-        queue = deque([start])
+    def iter_bfs(self, start, max_depth=None, visitor=None, with_info=False, visited=None):
+        """
+        Lazily yields nodes in Breadth-First Search (BFS) order.
+        :param start: Starting node.
+        :param max_depth: Do not expand nodes at this depth, or None for no limit.
+        :param visitor: Optional callback visitor(node, depth, parent); returning a
+                        truthy value stops the traversal after that node.
+        :param with_info: Yield (node, depth, parent) tuples instead of bare nodes.
+        :param visited: Optional set-like object (e.g. a compact set from the implicit
+                        module) recording the visited nodes.
+        """
+        if visited is None:
+            visited = set()
         visited.add(start)
+        queue = deque([(start, 0, None)])
+        successors = state_successors(self.adjacency_list)
 
         while queue:
-            current = queue.popleft()
-            print(current, end=" ")
+            current, depth, parent = queue.popleft()
+            yield (current, depth, parent) if with_info else current
+            if visitor is not None and visitor(current, depth, parent):
+                return
+            if max_depth is not None and depth >= max_depth:
+                continue
 
-            for neighbor in self.adjacency_list.get(current, []):
+            for neighbor in successors(current):
                 if neighbor not in visited:
                     visited.add(neighbor)
-                    queue.append(neighbor)
+                    queue.append((neighbor, depth + 1, current))
+
+    def bfs_levels(self, start, max_depth=None, visited=None):
+        """Lazily yields the BFS levels from start as lists of nodes."""
+        level, depth = [start], 0
+        if visited is None:
+            visited = set()
+        visited.add(start)
+        successors = state_successors(self.adjacency_list)
+        while level:
+            yield level
+            if max_depth is not None and depth >= max_depth:
+                return
+            next_level = []
+            for node in level:
+                for neighbor in successors(node):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_level.append(neighbor)
+            level, depth = next_level, depth + 1
+
+    def hop_distances(self, start, max_depth=None):
+        """Returns {node: number of edges on the shortest path from start}."""
+        return {node: depth for node, depth, _ in self.iter_bfs(start, max_depth, with_info=True)}
+
+    def dfs(self, start, visited=None):
+        """Performs Depth-First Search (DFS) from a starting node and prints the nodes."""
+        for node in self.iter_dfs(start, visited=visited):
+            print(node, end=" ")
+
+    def bfs(self, start):
+        """Performs Breadth-First Search (BFS) from a starting node and prints the nodes."""
+        for node in self.iter_bfs(start):
+            print(node, end=" ")
 
 
 # Test Cases
@@ -95,6 +562,35 @@ if __name__ == "__main__":
     print("Searching for 7:", "Found" if bst.search(7) else "Not Found")  # Output: Found
     print("Searching for 12:", "Found" if bst.search(12) else "Not Found")  # Output: Not Found
 
+    # Test Balanced BST
+    print("\nBalanced Binary Search Tree:")
+    avl = BinarySearchTree(balanced=True)
+    for key in range(100000):  # Sorted input no longer degrades into a list
+        avl.insert(key)
+    print("Height after 100000 sorted inserts:", avl.root.height)  # Output: 17
+    avl.delete(500)
+    print("Floor/ceiling of 500:", avl.floor(500), avl.ceiling(500))  # Output: 499 501
+    print("Keys in [498, 503]:", list(avl.range(498, 503)))  # Output: [498, 499, 501, 502, 503]
+
+    # Test Array-Backed BST
+    print("\nArray-Backed Binary Search Tree:")
+    compact = ArrayBinarySearchTree()
+    for key in (10, 5, 15, 3, 7):
+        compact.insert(key)
+    compact.delete(5)
+    print("Searching for 7:", "Found" if compact.search(7) else "Not Found")  # Output: Found
+    print("Sorted keys:", list(compact))  # Output: [3, 7, 10, 15]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tree.bin')
+        compact.save(path)
+        loaded = ArrayBinarySearchTree.load(path)
+        loaded.insert(12)
+        loaded.save(path)  # Overwrites the file the tree is still mapped from
+        loaded.close()
+        reloaded = ArrayBinarySearchTree.load(path)
+        print("Saved in place:", list(reloaded))  # Output: [3, 7, 10, 12, 15]
+        reloaded.close()
+
     # Test Graph with DFS and BFS
     print("\nGraph Traversal:")
     graph = Graph()
@@ -110,3 +606,12 @@ if __name__ == "__main__":
 
     print("\nBFS starting from node 1:")
     graph.bfs(1)  # Output: 1 2 3 4 5 6 7
+
+    print("\nBFS levels from node 1:", list(graph.bfs_levels(1)))  # Output: [[1], [2, 3], [4, 5, 6, 7]]
+    print("Hop distances from node 1:", graph.hop_distances(1, max_depth=1))  # Output: {1: 0, 2: 1, 3: 1}
+    first_leaf = next(node for node in graph.iter_dfs(1) if node not in graph.adjacency_list)
+    print("First leaf reached by DFS:", first_leaf)  # Output: 4
+
+    # Lazily generated state space: from n, move to n + 1 or 2n
+    counter = Graph.from_successors(lambda n: [(n + 1, 1), (2 * n, 1)])
+    print("Hops from 1 to 100:", next(d for n, d, _ in counter.iter_bfs(1, with_info=True) if n == 100))  # Output: 8